@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 import itertools
 import re
 from typing import Any, NamedTuple
+import weakref
 
 import astroid
+import astroid.bases
 import astroid.nodes
 
 
@@ -66,9 +68,67 @@ def get_full_import_name(import_from: astroid.nodes.ImportFrom, name: str) -> st
     return f"{module_name}.{partial_basename}"
 
 
+class QualnameCacheStats(NamedTuple):
+    hits: int
+    misses: int
+
+
+# Mapping of {(scope, partial name, is call) -> fully qualified name}
+_QUALNAMES: dict[tuple[astroid.nodes.NodeNG, str, bool], str] = {}
+_qualname_hits = 0
+
+
+def clear_qualname_cache() -> QualnameCacheStats:
+    """Forget the names resolved by :func:`resolve_qualname`.
+
+    Returns:
+        How often a name was found in the cache since it was last cleared.
+    """
+    global _qualname_hits
+
+    stats = QualnameCacheStats(_qualname_hits, len(_QUALNAMES))
+    _QUALNAMES.clear()
+    _qualname_hits = 0
+    return stats
+
+
+def _get_cache_scope(
+    lookup_node: astroid.nodes.LocalsDictNodeNG, name: str
+) -> astroid.nodes.LocalsDictNodeNG | None:
+    """Get the scope to cache what a name resolves to under.
+
+    Args:
+        lookup_node: The scope that the name is looked up from.
+        name: The name to look up.
+
+    Returns:
+        The module when the name is not defined in any enclosing function
+        or class, because it resolves to the same thing anywhere in the module.
+        Otherwise the scope that the name is looked up from.
+        ``None`` when the name is bound more than once in the scope
+        that defines it, because what it resolves to then depends on
+        where it is looked up.
+    """
+    scope = lookup_node
+    while True:
+        bindings = scope.locals.get(name, ())
+        if len(bindings) > 1:
+            return None
+        if isinstance(scope, astroid.nodes.Module):
+            return scope
+        if bindings:
+            return lookup_node
+        if any(param.name == name for param in getattr(scope, "type_params", ())):
+            return lookup_node
+        scope = scope.parent.scope()
+
+
 def resolve_qualname(node: astroid.nodes.NodeNG, basename: str) -> str:
     """Resolve where a node is defined to get its fully qualified name.
 
+    Names that are bound once are cached by the scope that they are looked up in,
+    until :func:`clear_qualname_cache` is called.
+
     Args:
         node: The node representing the base name.
         basename: The partial base name to resolve.
@@ -76,14 +136,41 @@ def resolve_qualname(node: astroid.nodes.NodeNG, basename: str) -> str:
     Returns:
         The fully resolved base name.
     """
-    full_basename = basename
+    global _qualname_hits
 
-    top_level_name = re.sub(r"\(.*\)", "", basename).split(".", 1)[0]
+    top_level_name = basename
+    if "(" in top_level_name:
+        top_level_name = re.sub(r"\(.*\)", "", top_level_name)
+    top_level_name = top_level_name.split(".", 1)[0]
     if isinstance(node, astroid.nodes.LocalsDictNodeNG):
         lookup_node = node
     else:
         lookup_node = node.scope()
 
+    cache_scope = _get_cache_scope(lookup_node, top_level_name)
+    if cache_scope is None:
+        return _resolve_qualname(node, lookup_node, basename, top_level_name)
+
+    key = (cache_scope, basename, isinstance(node, astroid.nodes.Call))
+    full_basename = _QUALNAMES.get(key)
+    if full_basename is not None:
+        _qualname_hits += 1
+        return full_basename
+
+    full_basename = _QUALNAMES[key] = _resolve_qualname(
+        node, lookup_node, basename, top_level_name
+    )
+    return full_basename
+
+
+def _resolve_qualname(
+    node: astroid.nodes.NodeNG,
+    lookup_node: astroid.nodes.LocalsDictNodeNG,
+    basename: str,
+    top_level_name: str,
+) -> str:
+    full_basename = basename
+
     type_params: set[str] = set()
     if hasattr(lookup_node, "type_params"):
         type_params = {x.name for x in lookup_node.type_params}
@@ -120,6 +207,94 @@ def resolve_qualname(node: astroid.nodes.NodeNG, basename: str) -> str:
     return full_basename
 
 
+def get_base_qualname(node: astroid.nodes.NodeNG) -> str | None:
+    """Get the fully qualified name of a base class without inferring it.
+
+    Args:
+        node: The node representing the base class.
+
+    Returns:
+        The fully qualified name of the base class,
+        or None if the base class is not referenced by name.
+    """
+    while isinstance(node, (astroid.nodes.Subscript, astroid.nodes.Call)):
+        node = node.value if isinstance(node, astroid.nodes.Subscript) else node.func
+
+    if not isinstance(node, (astroid.nodes.Name, astroid.nodes.Attribute)):
+        return None
+
+    return resolve_qualname(node, node.as_string())
+
+
+def _is_beyond_boundary(node: astroid.nodes.NodeNG, boundary: frozenset[str]) -> bool:
+    qualname = get_base_qualname(node)
+    return qualname is not None and qualname.split(".", 1)[0] in boundary
+
+
+def get_ancestors(
+    node: astroid.nodes.ClassDef,
+    boundary: frozenset[str] = frozenset(),
+    budget: int | None = None,
+) -> Iterator[astroid.nodes.ClassDef]:
+    """Iterate over the base classes of a class in prefixed depth first order.
+
+    Args:
+        node: The class definition node to get the ancestors of.
+        boundary: The names of top level packages to stop at.
+            Bases imported from these packages are not inferred,
+            so the modules that define them are never loaded.
+        budget: The maximum number of bases to infer.
+            Ancestors beyond the budget are not returned.
+            ``None`` for no limit.
+
+    Returns:
+        The base classes.
+    """
+    if not boundary and budget is None:
+        yield from node.ancestors(recurs=True)
+        return
+
+    remaining = budget
+    yielded = {node}
+
+    def _ancestors(
+        class_node: astroid.nodes.ClassDef,
+    ) -> Iterator[astroid.nodes.ClassDef]:
+        nonlocal remaining
+
+        for base in class_node.bases:
+            if boundary and _is_beyond_boundary(base, boundary):
+                continue
+
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+
+            try:
+                inferred = list(base.infer())
+            except astroid.InferenceError:
+                continue
+
+            for base_node in inferred:
+                if isinstance(base_node, astroid.bases.Instance):
+                    base_node = base_node._proxied
+                if not isinstance(base_node, astroid.nodes.ClassDef):
+                    continue
+                # The base may have been re-exported outside of the boundary.
+                if base_node.root().name.split(".", 1)[0] in boundary:
+                    continue
+                if base_node in yielded:
+                    continue
+
+                yielded.add(base_node)
+                if not base_node.hide:
+                    yield base_node
+                yield from _ancestors(base_node)
+
+    yield from _ancestors(node)
+
+
 def get_full_basenames(node: astroid.nodes.ClassDef) -> Iterable[str]:
     """Resolve the partial names of a class' bases to fully qualified names.
 
@@ -257,11 +432,69 @@ def get_assign_annotation(
     return format_annotation(annotation_node)
 
 
-def is_decorated_with_property(node: astroid.nodes.FunctionDef) -> bool:
+# Mapping of {module -> {(scope id, check, decorator source, *args) -> result}}
+# The scope is stored by id so that the results do not keep the module alive.
+_DECORATOR_CHECKS: weakref.WeakKeyDictionary[
+    astroid.nodes.Module, dict[tuple[Any, ...], bool]
+] = weakref.WeakKeyDictionary()
+
+
+def _check_decorator(
+    decorator: astroid.nodes.NodeNG,
+    check: Callable[..., bool],
+    *args: Any,
+) -> bool:
+    """Check a decorator, reusing the result for the same decorator in a scope.
+
+    Modules tend to use the same few decorators on many functions,
+    so each distinct decorator is inferred only once per scope
+    that its name is looked up in.
+
+    Args:
+        decorator: The decorator to check.
+        check: The check to run on the decorator.
+        *args: Extra arguments to pass to the check.
+
+    Returns:
+        The result of the check, or False if the decorator could not be inferred.
+    """
+    source = decorator.as_string()
+    cache_scope = _get_cache_scope(decorator.scope(), source.split(".", 1)[0])
+    if cache_scope is None:
+        return _run_decorator_check(decorator, check, *args)
+
+    results = _DECORATOR_CHECKS.setdefault(decorator.root(), {})
+    key = (id(cache_scope), check, source, *args)
+    result = results.get(key)
+    if result is None:
+        result = results[key] = _run_decorator_check(decorator, check, *args)
+
+    return result
+
+
+def _run_decorator_check(
+    decorator: astroid.nodes.NodeNG,
+    check: Callable[..., bool],
+    *args: Any,
+) -> bool:
+    try:
+        return check(decorator, *args)
+    except astroid.InferenceError:
+        return False
+
+
+def is_decorated_with_property(
+    node: astroid.nodes.FunctionDef,
+    boundary: frozenset[str] = frozenset(),
+    budget: int | None = None,
+) -> bool:
     """Check if the function is decorated as a property.
 
     Args:
         node: The node to check.
+        boundary: The names of top level packages to stop inference at.
+        budget: The maximum number of bases to infer
+            when checking the ancestors of each decorator.
 
     Returns:
         True if the function is a property, False otherwise.
@@ -273,16 +506,17 @@ def is_decorated_with_property(node: astroid.nodes.FunctionDef) -> bool:
         if not isinstance(decorator, astroid.nodes.Name):
             continue
 
-        try:
-            if _is_property_decorator(decorator):
-                return True
-        except astroid.InferenceError:
-            pass
+        if _check_decorator(decorator, _is_property_decorator, boundary, budget):
+            return True
 
     return False
 
 
-def _is_property_decorator(decorator: astroid.nodes.Name) -> bool:
+def _is_property_decorator(
+    decorator: astroid.nodes.Name,
+    boundary: frozenset[str] = frozenset(),
+    budget: int | None = None,
+) -> bool:
     def _is_property_class(class_node: astroid.nodes.ClassDef) -> bool:
         return (
             class_node.name == "property"
@@ -292,6 +526,9 @@ def _is_property_decorator(decorator: astroid.nodes.Name) -> bool:
             and class_node.root().name == "functools"
         )
 
+    if boundary and _is_beyond_boundary(decorator, boundary):
+        return False
+
     for inferred in decorator.infer():
         if not isinstance(inferred, astroid.nodes.ClassDef):
             continue
@@ -299,7 +536,10 @@ def _is_property_decorator(decorator: astroid.nodes.Name) -> bool:
         if _is_property_class(inferred):
             return True
 
-        if any(_is_property_class(ancestor) for ancestor in inferred.ancestors()):
+        if any(
+            _is_property_class(ancestor)
+            for ancestor in get_ancestors(inferred, boundary, budget)
+        ):
             return True
 
     return False
@@ -343,11 +583,8 @@ def is_decorated_with_overload(node: astroid.nodes.FunctionDef) -> bool:
         if not isinstance(decorator, (astroid.nodes.Name, astroid.nodes.Attribute)):
             continue
 
-        try:
-            if _is_overload_decorator(decorator):
-                return True
-        except astroid.InferenceError:
-            pass
+        if _check_decorator(decorator, _is_overload_decorator):
+            return True
 
     return False
 
@@ -381,22 +618,39 @@ def is_constructor(node: astroid.nodes.FunctionDef) -> bool:
     )
 
 
-def is_exception(node: astroid.nodes.ClassDef) -> bool:
+def _is_builtin_exception(node: astroid.nodes.ClassDef) -> bool:
+    return (
+        node.name in ("Exception", "BaseException") and node.root().name == "builtins"
+    )
+
+
+def is_exception(
+    node: astroid.nodes.ClassDef,
+    boundary: frozenset[str] = frozenset(),
+    budget: int | None = None,
+) -> bool:
     """Check if a class is an exception.
 
     Args:
         node: The node to check.
+        boundary: The names of top level packages to stop inference at.
+        budget: The maximum number of bases to infer.
 
     Returns:
         True if the class is an exception, False otherwise.
     """
-    if node.name in ("Exception", "BaseException") and node.root().name == "builtins":
+    if _is_builtin_exception(node):
         return True
 
     if not hasattr(node, "ancestors"):
         return False
 
-    return any(is_exception(parent) for parent in node.ancestors(recurs=True))
+    # The ancestors are already recursive,
+    # so there is no need to check the ancestors of each ancestor.
+    return any(
+        _is_builtin_exception(parent)
+        for parent in get_ancestors(node, boundary, budget)
+    )
 
 
 def is_local_import_from(node: astroid.nodes.NodeNG, package_name: str) -> bool:
@@ -703,11 +957,17 @@ def get_return_annotation(node: astroid.nodes.FunctionDef) -> str | None:
     return return_annotation
 
 
-def get_class_docstring(node: astroid.nodes.ClassDef) -> str:
+def get_class_docstring(
+    node: astroid.nodes.ClassDef,
+    boundary: frozenset[str] = frozenset(),
+    budget: int | None = None,
+) -> str:
     """Get the docstring of a node, using a parent docstring if needed.
 
     Args:
         node: The node to get a docstring for.
+        boundary: The names of top level packages to stop inference at.
+        budget: The maximum number of bases to infer.
 
     Returns:
         The docstring of the class, or the empty string if no docstring
@@ -716,7 +976,7 @@ def get_class_docstring(node: astroid.nodes.ClassDef) -> str:
     doc = node.doc_node.value if node.doc_node else ""
 
     if not doc:
-        for base in node.ancestors():
+        for base in get_ancestors(node, boundary, budget):
             if base.qname() in (
                 "__builtins__.object",
                 "builtins.object",
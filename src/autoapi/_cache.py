@@ -0,0 +1,141 @@
+"""Helpers for the caches that AutoAPI stores on disk."""
+
+import contextlib
+import os
+import pickle
+import sys
+import types
+
+
+@contextlib.contextmanager
+def replace_atomically(path):
+    """Open a temporary file that replaces a file once it has been written.
+
+    Other processes may be writing the same file in a parallel build,
+    so each process writes to a file of its own,
+    and the file is only ever seen complete.
+
+    Args:
+        path (str or os.PathLike): The file to replace.
+
+    Yields:
+        io.BufferedWriter: The temporary file, opened for writing bytes.
+    """
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as tmp_file:
+            yield tmp_file
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, path)
+
+
+def load_pickle(path, settings):
+    """Load data that was stored with :func:`save_pickle`.
+
+    Args:
+        path (str): The file that the data is stored in.
+        settings: What the data depends on.
+
+    Returns:
+        The stored data, or ``None`` if the file cannot be read
+        or the data was stored with other settings.
+    """
+    try:
+        with open(path, "rb") as cache_file:
+            stored_settings, data = pickle.load(cache_file)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+
+    if stored_settings != settings:
+        return None
+
+    return data
+
+
+def save_pickle(path, settings, data):
+    """Store data alongside what it depends on.
+
+    Args:
+        path (str): The file to store the data in.
+            Missing parent directories are created.
+        settings: What the data depends on.
+        data: The data to store.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with replace_atomically(path) as cache_file:
+        pickle.dump((settings, data), cache_file, pickle.HIGHEST_PROTOCOL)
+
+
+def get_handler_name(handler):
+    """Get the fully qualified name of an event handler.
+
+    Args:
+        handler (callable): The handler.
+
+    Returns:
+        str: The name of the handler.
+    """
+    qual_name = getattr(handler, "__qualname__", type(handler).__qualname__)
+    # Functions defined in conf.py do not belong to a module.
+    module_name = getattr(handler, "__module__", None)
+    if not module_name:
+        return qual_name
+
+    return f"{module_name}.{qual_name}"
+
+
+def _describe_code(code):
+    return (
+        code.co_code,
+        code.co_names,
+        tuple(
+            _describe_code(const) if isinstance(const, types.CodeType) else const
+            for const in code.co_consts
+        ),
+    )
+
+
+def _describe_value(value):
+    try:
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # The value cannot be described,
+        # so make sure that the description never matches a previous build.
+        return os.urandom(16)
+
+
+def describe_function(function):
+    """Describe a function in a way that changes when the function changes.
+
+    Args:
+        function (callable): The function to describe.
+
+    Returns:
+        tuple: The name of the function, the version of the package
+        that it belongs to, its code and constants, its default arguments,
+        and the values that it closes over.
+    """
+    module_name = getattr(function, "__module__", None) or ""
+    package = sys.modules.get(module_name.split(".", 1)[0])
+    function = getattr(function, "__func__", function)
+    code = getattr(function, "__code__", None)
+    cells = []
+    for cell in getattr(function, "__closure__", None) or ():
+        try:
+            cells.append(_describe_value(cell.cell_contents))
+        except ValueError:
+            # The variable has not been assigned to yet.
+            cells.append(None)
+
+    return (
+        get_handler_name(function),
+        getattr(package, "__version__", None),
+        _describe_code(code) if code else None,
+        _describe_value(getattr(function, "__defaults__", None)),
+        _describe_value(getattr(function, "__kwdefaults__", None)),
+        cells,
+    )
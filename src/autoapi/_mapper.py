@@ -1,23 +1,28 @@
 import collections
+import contextlib
 import copy
 import fnmatch
+import hashlib
+import importlib.metadata
 import itertools
 import operator
 import os
+import pickle
 import re
 import sys
+import time
 
 from jinja2 import Environment, FileSystemLoader
 import sphinx
-import sphinx.environment
 from sphinx.errors import ExtensionError
 import sphinx.util
 import sphinx.util.logging
 from sphinx.util.console import colorize
 from sphinx.util.display import status_iterator
 from sphinx.util.osutil import ensuredir
+from sphinx.util.parallel import ParallelTasks, make_chunks, parallel_available
 
-from ._parser import Parser
+from ._cache import describe_function, get_handler_name, load_pickle, save_pickle
 from ._objects import (
     PythonClass,
     PythonFunction,
@@ -29,136 +34,279 @@ from ._objects import (
     PythonData,
     PythonException,
 )
+from ._paths import get_module_name, is_package_dir
 from .settings import OWN_PAGE_LEVELS, TEMPLATE_DIR
 
 
 LOGGER = sphinx.util.logging.getLogger(__name__)
 
 
-def _expand_wildcard_placeholder(original_module, originals_map, placeholder):
-    """Expand a wildcard placeholder to a sequence of named placeholders.
+def _get_wildcard_exports(original_module, originals_map):
+    """Get the objects that a wildcard import of a module imports.
 
     :param original_module: The data dictionary of the module
-        that the placeholder is imported from.
+        that the objects are imported from.
     :type original_module: dict
     :param originals_map: A map of the names of children under the module
         to their data dictionaries.
     :type originals_map: dict(str, dict)
-    :param placeholder: The wildcard placeholder to expand.
-    :type placeholder: dict
 
-    :returns: The placeholders that the wildcard placeholder represents.
+    :returns: The objects that a wildcard import of the module imports.
     :rtype: list(dict)
     """
-    originals = originals_map.values()
-    if original_module["all"] is not None:
-        originals = []
-        for name in original_module["all"]:
-            if name == "__all__":
-                continue
+    if original_module["all"] is None:
+        return list(originals_map.values())
 
-            if name not in originals_map:
-                msg = f"Invalid __all__ entry {name} in {original_module['name']}"
-                LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
+    originals = []
+    for name in original_module["all"]:
+        if name == "__all__":
+            continue
+
+        if name not in originals_map:
+            msg = f"Invalid __all__ entry {name} in {original_module['name']}"
+            LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
+            continue
+
+        originals.append(originals_map[name])
+
+    return originals
+
+
+def _get_import_graph(modules):
+    """Get the documented modules that each module imports objects from.
+
+    Args:
+        modules (dict(str, tuple(dict, dict(str, dict)))): A mapping of module
+            names to their data dictionary and the children of the module
+            by name.
+
+    Returns:
+        dict(str, dict(str, None)): A mapping of module names to
+        the ordered set of names of the documented modules that
+        the placeholders of the module are imported from.
+        Modules that import from themselves are included in their own set.
+    """
+    graph = {}
+    for module_name, (_, children) in modules.items():
+        graph[module_name] = {}
+        for child in children.values():
+            if child["type"] != "placeholder" or child["original_path"] in modules:
                 continue
 
-            originals.append(originals_map[name])
-
-    placeholders = []
-    for original in originals:
-        new_full_name = placeholder["full_name"].replace("*", original["name"])
-        new_qual_name = placeholder["qual_name"].replace("*", original["name"])
-        new_original_path = placeholder["original_path"].replace("*", original["name"])
-        if "original_path" in original:
-            new_original_path = original["original_path"]
-        new_placeholder = dict(
-            placeholder,
-            name=original["name"],
-            qual_name=new_qual_name,
-            full_name=new_full_name,
-            original_path=new_original_path,
-        )
-        placeholders.append(new_placeholder)
+            imported_from = child["original_path"].rsplit(".", 1)[0]
+            if imported_from in modules:
+                graph[module_name][imported_from] = None
 
-    return placeholders
+    return graph
 
 
-def _resolve_module_placeholders(modules, module_name, visit_path, resolved):
-    """Resolve all placeholder children under a module.
+def _strongly_connected_components(graph):
+    """Find the strongly connected components of a directed graph.
+
+    This is an iterative implementation of Tarjan's algorithm,
+    so the depth of the graph is not limited by the recursion limit.
 
     Args:
-        modules (dict(str, dict)): A mapping of module names to their
-            data dictionary. Placeholders are resolved in place.
-        module_name (str): The name of the module to resolve.
-        visit_path: An ordered set of visited module names.
-        visited (collections.OrderedDict)
-        resolved (set(str)): A set of already resolved module names.
+        graph (dict(str, iterable(str))): A mapping of each node
+            to the nodes that it has an edge to.
+
+    Yields:
+        list(str): The nodes of each component.
+        A component is yielded after every component that it has an edge to.
     """
-    if module_name in resolved:
-        return
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
 
-    visit_path[module_name] = True
+    for root in graph:
+        if root in index:
+            continue
 
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, edges = work[-1]
+            for target in edges:
+                if target not in index:
+                    index[target] = lowlink[target] = len(index)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(graph[target])))
+                    break
+
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    yield component
+
+
+def _remove_placeholder(modules, module_name, placeholder):
     module, children = modules[module_name]
-    for child in list(children.values()):
-        if child["type"] != "placeholder":
-            continue
+    module["children"].remove(placeholder)
+    children.pop(placeholder["name"])
 
-        if child["original_path"] in modules:
-            module["children"].remove(child)
-            children.pop(child["name"])
-            continue
 
-        imported_from, original_name = child["original_path"].rsplit(".", 1)
-        if imported_from in visit_path:
-            visit_str = ", ".join(visit_path)
-            msg = f"Cannot resolve cyclic import: {visit_str}, {imported_from}"
-            LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
-            module["children"].remove(child)
-            children.pop(child["name"])
-            continue
+def _resolve_component_placeholders(modules, component, exports=None):
+    """Resolve all placeholder children under a strongly connected set of modules.
 
-        if imported_from not in modules:
-            msg = (
-                f"Cannot resolve import of unknown module {imported_from}"
-                f" in {module_name}"
-            )
-            LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
-            module["children"].remove(child)
-            children.pop(child["name"])
-            continue
+    Every module that the component imports from, outside of the component,
+    must have been resolved already.
+    Within a component of modules that import from each other,
+    a placeholder is resolved as soon as the object that it imports
+    is no longer a placeholder itself,
+    so the result does not depend on the order of the modules.
+    Any placeholders that can never be resolved are removed.
 
-        _resolve_module_placeholders(modules, imported_from, visit_path, resolved)
+    Args:
+        modules (dict(str, tuple(dict, dict(str, dict)))): A mapping of module
+            names to their data dictionary and the children of the module
+            by name. Placeholders are resolved in place.
+        component (list(str)): The names of the modules to resolve.
+        exports (dict(str, list(dict)) or None): A mapping of module names
+            to the objects that a wildcard import of the module imports.
+            This is shared between calls so that the objects are found
+            only once for each module.
+    """
+    if exports is None:
+        exports = {}
+
+    members = set(component)
+    pending = []
+    # Mapping of {module name -> the number of unresolved placeholders}
+    pending_counts = collections.Counter()
+    # Mapping of {module name -> the number of unresolved wildcard placeholders}
+    pending_wildcards = collections.Counter()
+    for module_name in component:
+        for child in list(modules[module_name][1].values()):
+            if child["type"] != "placeholder":
+                continue
+
+            if child["original_path"] in modules:
+                _remove_placeholder(modules, module_name, child)
+                continue
+
+            imported_from, original_name = child["original_path"].rsplit(".", 1)
+            if imported_from not in modules:
+                msg = (
+                    f"Cannot resolve import of unknown module {imported_from}"
+                    f" in {module_name}"
+                )
+                LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
+                _remove_placeholder(modules, module_name, child)
+                continue
+
+            pending.append((module_name, child, imported_from, original_name))
+            pending_counts[module_name] += 1
+            if original_name == "*":
+                pending_wildcards[module_name] += 1
+
+    def _is_ready(imported_from, original_name):
+        if imported_from not in members:
+            return True
 
         if original_name == "*":
-            original_module, originals_map = modules[imported_from]
+            return not pending_counts[imported_from]
+
+        original = modules[imported_from][1].get(original_name)
+        if original is None:
+            return not pending_wildcards[imported_from]
+
+        return original["type"] != "placeholder"
+
+    while pending:
+        blocked = []
+        for module_name, child, imported_from, original_name in pending:
+            if not _is_ready(imported_from, original_name):
+                blocked.append((module_name, child, imported_from, original_name))
+                continue
 
-            # Replace the wildcard placeholder
-            # with a list of named placeholders.
-            new_placeholders = _expand_wildcard_placeholder(
-                original_module, originals_map, child
+            _resolve_module_placeholder(
+                modules, module_name, child, imported_from, original_name, exports
             )
-            child_index = module["children"].index(child)
-            module["children"][child_index : child_index + 1] = new_placeholders
-            children.pop(child["name"])
-
-            for new_placeholder in new_placeholders:
-                if new_placeholder["name"] not in children:
-                    children[new_placeholder["name"]] = new_placeholder
-                original = originals_map[new_placeholder["name"]]
-                _resolve_placeholder(new_placeholder, original)
-        elif original_name not in modules[imported_from][1]:
-            msg = f"Cannot resolve import of {child['original_path']} in {module_name}"
-            LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
-            module["children"].remove(child)
-            children.pop(child["name"])
-            continue
-        else:
-            original = modules[imported_from][1][original_name]
-            _resolve_placeholder(child, original)
+            pending_counts[module_name] -= 1
+            if original_name == "*":
+                pending_wildcards[module_name] -= 1
+
+        if len(blocked) == len(pending):
+            break
 
-    del visit_path[module_name]
-    resolved.add(module_name)
+        pending = blocked
+
+    for module_name, child, _, _ in pending:
+        cycle_str = ", ".join(sorted(members))
+        msg = (
+            f"Cannot resolve cyclic import of {child['original_path']}"
+            f" in {module_name}: {cycle_str}"
+        )
+        LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
+        _remove_placeholder(modules, module_name, child)
+
+
+def _resolve_module_placeholder(
+    modules, module_name, placeholder, imported_from, original_name, exports
+):
+    """Resolve a placeholder child of a module.
+
+    Args:
+        modules (dict(str, tuple(dict, dict(str, dict)))): A mapping of module
+            names to their data dictionary and the children of the module
+            by name. Placeholders are resolved in place.
+        module_name (str): The name of the module that the placeholder is in.
+        placeholder (dict): The placeholder to resolve.
+        imported_from (str): The name of the module that
+            the placeholder is imported from.
+        original_name (str): The name of the imported object,
+            or ``"*"`` for a wildcard import.
+        exports (dict(str, list(dict))): A mapping of module names
+            to the objects that a wildcard import of the module imports.
+    """
+    module, children = modules[module_name]
+    if original_name == "*":
+        if imported_from not in exports:
+            exports[imported_from] = _get_wildcard_exports(*modules[imported_from])
+
+        # Replace the wildcard placeholder with the objects that it imports.
+        new_children = [
+            _copy_original(
+                original,
+                original["name"],
+                placeholder["qual_name"].replace("*", original["name"]),
+                placeholder["full_name"].replace("*", original["name"]),
+            )
+            for original in exports[imported_from]
+        ]
+        child_index = module["children"].index(placeholder)
+        module["children"][child_index : child_index + 1] = new_children
+        children.pop(placeholder["name"])
+
+        for new_child in new_children:
+            if new_child["name"] not in children:
+                children[new_child["name"]] = new_child
+    elif original_name not in modules[imported_from][1]:
+        msg = (
+            f"Cannot resolve import of {placeholder['original_path']} in {module_name}"
+        )
+        LOGGER.warning(msg, type="autoapi", subtype="python_import_resolution")
+        _remove_placeholder(modules, module_name, placeholder)
+    else:
+        original = modules[imported_from][1][original_name]
+        _resolve_placeholder(placeholder, original)
 
 
 def _resolve_placeholder(placeholder, original):
@@ -168,14 +316,36 @@ def _resolve_placeholder(placeholder, original):
         placeholder (dict): The placeholder to resolve, in place.
         original (dict): The object that the placeholder represents.
     """
+    new = _copy_original(
+        original,
+        placeholder["name"],
+        placeholder["qual_name"],
+        placeholder["full_name"],
+    )
+    placeholder.clear()
+    placeholder.update(new)
+
+
+def _copy_original(original, name, qual_name, full_name):
+    """Copy an imported object to the location that it is imported to.
+
+    Args:
+        original (dict): The object that is imported.
+        name (str): The name that the object is imported as.
+        qual_name (str): The qualified name of the imported object.
+        full_name (str): The fully qualified name of the imported object.
+
+    Returns:
+        dict: The copy of the object.
+    """
     new = copy.deepcopy(original)
     # We are supposed to be resolving the placeholder,
     # not replacing it with another.
     assert original["type"] != "placeholder"
     # The name remains the same.
-    new["name"] = placeholder["name"]
-    new["qual_name"] = placeholder["qual_name"]
-    new["full_name"] = placeholder["full_name"]
+    new["name"] = name
+    new["qual_name"] = qual_name
+    new["full_name"] = full_name
     # Record where the placeholder originally came from.
     new["original_path"] = original["full_name"]
     # The source lines for this placeholder do not exist in this file.
@@ -198,8 +368,108 @@ def _resolve_placeholder(placeholder, original):
         # Resolve the remaining children
         stack.extend(child.get("children", ()))
 
-    placeholder.clear()
-    placeholder.update(new)
+    return new
+
+
+def _visit_tree(roots, visitors, get_children, get_name):
+    """Visit every descendant of the given objects, parents before children.
+
+    Descendants are visited in the order that they appear in their parent.
+
+    Args:
+        roots (iterable): The objects to visit the descendants of.
+        visitors (list(callable)): Called in order for each descendant
+            with the root that it is under, its parent, the descendant itself,
+            and the dotted name of the descendant relative to the root.
+        get_children (callable): Get the children of an object.
+        get_name (callable): Get the name of an object.
+    """
+    for root in roots:
+        stack = [
+            (root, child, get_name(child)) for child in reversed(get_children(root))
+        ]
+        while stack:
+            parent, obj, path = stack.pop()
+            for visitor in visitors:
+                visitor(root, parent, obj, path)
+            stack.extend(
+                (obj, child, f"{path}.{get_name(child)}")
+                for child in reversed(get_children(obj))
+            )
+
+
+def _visit_data(roots, visitors):
+    """Visit every descendant of the given parsed data.
+
+    Args:
+        roots (iterable(dict)): The data to visit the descendants of.
+        visitors (list(callable)): See :func:`_visit_tree`.
+    """
+    _visit_tree(
+        roots,
+        visitors,
+        operator.methodcaller("get", "children", ()),
+        operator.itemgetter("name"),
+    )
+
+
+def _visit_objects(roots, visitors):
+    """Visit every descendant of the given mapped objects.
+
+    Args:
+        roots (iterable(PythonObject)): The objects to visit the descendants of.
+        visitors (list(callable)): See :func:`_visit_tree`.
+    """
+    _visit_tree(
+        roots,
+        visitors,
+        operator.attrgetter("children"),
+        operator.attrgetter("name"),
+    )
+
+
+def _viewcode_location_visitor(all_locations):
+    """Create a visitor that records the location of objects for use by viewcode.
+
+    Args:
+        all_locations (dict(str, dict)): The locations of the objects
+            in each module are stored in here, by module name.
+            See :func:`_get_viewcode_locations`.
+
+    Returns:
+        callable: The visitor.
+    """
+
+    def _visit(module, parent, obj, path):
+        if not isinstance(module, (PythonModule, PythonPackage)):
+            return
+
+        locations = all_locations.setdefault(module.id, {})
+        if "from_line_no" in obj.obj:
+            type_ = "other"
+            if obj.type == "class":
+                type_ = "class"
+            elif obj.type in ("function", "method"):
+                type_ = "def"
+            locations[path] = (type_, obj.obj["from_line_no"], obj.obj["to_line_no"])
+
+    return _visit
+
+
+def _get_viewcode_locations(module):
+    """Get the location of each object in a module for use by viewcode.
+
+    Args:
+        module (PythonModule): The module to get the locations of.
+
+    Returns:
+        dict(str, tuple(str, int, int)): A mapping of the names of objects,
+        relative to the module, to the type of object
+        and the lines that the object spans.
+    """
+    all_locations = {module.id: {}}
+    _visit_objects([module], [_viewcode_location_visitor(all_locations)])
+    return all_locations[module.id]
 
 
 def _link_objs(value):
@@ -224,20 +494,449 @@ def _link_objs(value):
     return result[:-2]
 
 
+def _compile_patterns(patterns):
+    """Compile multiple fnmatch style patterns into a single regular expression.
+
+    Args:
+        patterns (list(str)): The patterns to compile.
+
+    Returns:
+        re.Pattern or None: The compiled patterns,
+        or ``None`` if no patterns were given.
+    """
+    if not patterns:
+        return None
+
+    return re.compile(
+        "|".join(
+            f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+            for pattern in patterns
+        )
+    )
+
+
 def _path_matches_patterns(path, patterns):
     """Check if a path matches one of multiple patterns
 
     Args:
         path (str): path to a file or directory to check
-        patterns (list): list of patterns for fnmatch
+        patterns (re.Pattern or None): The patterns compiled with
+            :func:`_compile_patterns`.
 
     Returns:
         bool: Whether or not the path matches a pattern in patterns
     """
-    for pattern in patterns:
-        if fnmatch.fnmatch(path, pattern):
+    if patterns is None:
+        return False
+
+    return patterns.match(os.path.normcase(path)) is not None
+
+
+# The ``autodoc-process-docstring`` handlers that depend only on
+# the type, name and lines of a docstring, and have no side effects.
+_PURE_DOCSTRING_HANDLERS = frozenset(("sphinx.ext.napoleon._process_docstring",))
+
+
+def _are_docstring_handlers_pure(app):
+    """Check whether every ``autodoc-process-docstring`` handler is pure.
+
+    Args:
+        app (sphinx.application.Sphinx): The Sphinx application.
+
+    Returns:
+        bool: Whether at least one handler is connected,
+        and every connected handler is known to be pure.
+    """
+    pure = _PURE_DOCSTRING_HANDLERS.union(app.config.autoapi_pure_docstring_handlers)
+    listeners = app.events.listeners.get("autodoc-process-docstring", ())
+    return bool(listeners) and all(
+        get_handler_name(listener.handler) in pure for listener in listeners
+    )
+
+
+def _get_docstring_settings(app):
+    """Get what the result of processing a docstring depends on.
+
+    This is the ``autodoc-process-docstring`` handlers that are connected,
+    the version of the package that each one belongs to,
+    and the configuration values that are named after those packages,
+    such as the ``napoleon_*`` values for :mod:`sphinx.ext.napoleon`.
+
+    Args:
+        app (sphinx.application.Sphinx): The Sphinx application.
+
+    Returns:
+        str: A digest of the settings.
+    """
+    handlers = _get_handlers(app, "autodoc-process-docstring")
+    prefixes = set()
+    for listener in app.events.listeners.get("autodoc-process-docstring", ()):
+        module_name = getattr(listener.handler, "__module__", None) or ""
+        prefixes.update(f"{part}_" for part in module_name.split(".") if part)
+
+    config = sorted(
+        (option.name, repr(option.value))
+        for option in app.config
+        if option.name.startswith(tuple(prefixes))
+    )
+    return hashlib.sha256(pickle.dumps((handlers, config))).hexdigest()
+
+
+def _get_handlers(app, event):
+    """Describe the handlers that are connected to an event.
+
+    Args:
+        app (sphinx.application.Sphinx): The Sphinx application.
+        event (str): The name of the event.
+
+    Returns:
+        list(tuple): The description of each handler and its priority.
+    """
+    return [
+        (*describe_function(listener.handler), listener.priority)
+        for listener in app.events.listeners.get(event, ())
+    ]
+
+
+# The configuration values that reading source files depends on.
+_PARSE_CONFIG = (
+    "autoapi_follow_symlinks",
+    "autoapi_inference_boundary",
+    "autoapi_inference_budget",
+    "autoapi_python_use_implicit_namespaces",
+)
+# The configuration values that mapping and rendering objects depends on.
+_RENDER_CONFIG = (
+    "autoapi_add_toctree_entry",
+    "autoapi_generate_api_docs",
+    "autoapi_include_summaries",
+    "autoapi_member_order",
+    "autoapi_options",
+    "autoapi_own_page_level",
+    "autoapi_python_class_content",
+    "autoapi_root",
+    "autoapi_skip_rules",
+    "autoapi_template_dir",
+    "autodoc_typehints",
+    "source_suffix",
+)
+
+
+def _get_parse_settings(app, patterns, dirs, ignore):
+    """Get what the data read from source files depends on.
+
+    Args:
+        app (sphinx.application.Sphinx): The Sphinx application.
+        patterns (list(str)): The patterns of the files to read.
+        dirs (list(str)): The directories to read files from.
+        ignore (list(str)): The patterns of the files to ignore.
+
+    Returns:
+        str: A digest of the settings.
+    """
+    from . import __version__
+
+    settings = (
+        __version__,
+        importlib.metadata.version("astroid"),
+        list(patterns),
+        list(dirs),
+        list(ignore or ()),
+        [repr(app.config[name]) for name in _PARSE_CONFIG],
+    )
+    return hashlib.sha256(pickle.dumps(settings)).hexdigest()
+
+
+def _get_render_settings(app):
+    """Get what the mapped and rendered objects depend on.
+
+    This includes the settings that processing docstrings depends on,
+    and the ``autoapi-skip-member`` handlers that are connected.
+
+    Args:
+        app (sphinx.application.Sphinx): The Sphinx application.
+
+    Returns:
+        str: A digest of the settings.
+    """
+    from . import __version__
+
+    prepare_jinja_env = app.config.autoapi_prepare_jinja_env
+    settings = (
+        __version__,
+        [repr(app.config[name]) for name in _RENDER_CONFIG],
+        describe_function(prepare_jinja_env) if prepare_jinja_env else None,
+        _get_docstring_settings(app),
+        _get_handlers(app, "autoapi-skip-member"),
+    )
+    return hashlib.sha256(pickle.dumps(settings)).hexdigest()
+
+
+class _DocstringCache:
+    """A cache of docstrings processed by ``autodoc-process-docstring`` handlers.
+
+    Only the docstrings that are looked up or added during a build
+    are kept when the cache is saved.
+
+    Args:
+        path (str or None): The file to store the processed docstrings in,
+            or ``None`` to keep them only in memory.
+        settings (str): A digest of what the processed docstrings depend on.
+            Docstrings that were processed with other settings are discarded.
+    """
+
+    def __init__(self, path, settings):
+        self._path = path
+        self._settings = settings
+        self._previous = {}
+        self._entries = {}
+        self.hits = 0
+
+        if path is not None:
+            self._previous = load_pickle(path, settings) or {}
+
+    @staticmethod
+    def _get_key(what, name, lines):
+        hasher = hashlib.sha256(f"{what}\0{name}\0".encode())
+        hasher.update("\n".join(lines).encode("utf-8", "surrogatepass"))
+        return hasher.digest()
+
+    def get(self, what, name, lines):
+        """Get the processed version of a docstring.
+
+        Args:
+            what (str): The type of the object that the docstring belongs to.
+            name (str): The name of the object that the docstring belongs to.
+            lines (list(str)): The lines of the docstring to process.
+
+        Returns:
+            list(str) or None: The processed lines,
+            or ``None`` if the docstring has not been processed before.
+        """
+        key = self._get_key(what, name, lines)
+        processed = self._entries.get(key)
+        if processed is None:
+            processed = self._previous.get(key)
+            if processed is None:
+                return None
+
+            self._entries[key] = processed
+
+        self.hits += 1
+        return list(processed)
+
+    def add(self, what, name, lines, processed):
+        """Record the processed version of a docstring.
+
+        Args:
+            what (str): The type of the object that the docstring belongs to.
+            name (str): The name of the object that the docstring belongs to.
+            lines (list(str)): The lines of the docstring before processing.
+            processed (list(str)): The lines of the docstring after processing.
+        """
+        self._entries[self._get_key(what, name, lines)] = tuple(processed)
+
+    @property
+    def entries(self):
+        """dict(bytes, tuple(str)): The docstrings used in this build, by key."""
+        return self._entries
+
+    def update(self, entries):
+        """Record docstrings that were processed elsewhere.
+
+        Args:
+            entries (dict(bytes, tuple(str))): The processed docstrings,
+                as given by :attr:`entries`.
+        """
+        self._entries.update(entries)
+
+    def save(self):
+        """Write the docstrings used in this build to disk."""
+        if self._path is None or self._entries.keys() == self._previous.keys():
+            return
+
+        save_pickle(self._path, self._settings, self._entries)
+
+
+class _DirectoryListings:
+    """A record of the contents of walked directories.
+
+    Directories that have not been modified since they were last recorded
+    are not read again.
+
+    Args:
+        key (tuple): The settings that the contents of directories depend on.
+        previous (_DirectoryListings or None): The listings recorded
+            by a previous build.
+    """
+
+    def __init__(self, key, previous=None):
+        self.key = key
+        self.listings = {}
+        self._previous = {}
+        if previous is not None and previous.key == key:
+            self._previous = previous.listings
+
+    def __getstate__(self):
+        """Obtains serialisable data for pickling."""
+        __dict__ = self.__dict__.copy()
+        __dict__["_previous"] = {}
+        return __dict__
+
+    def lookup(self, root):
+        """Get the recorded contents of a directory, if they are still valid.
+
+        Args:
+            root (str): The path to the directory.
+
+        Returns:
+            tuple(int, tuple(list(str), list(str)) or None): The modification
+            time of the directory, and the paths of its subdirectories
+            and the names of its files if the previous record is still valid.
+        """
+        mtime = os.stat(root).st_mtime_ns
+        previous = self._previous.get(root)
+        if previous is not None and previous[0] == mtime:
+            self.listings[root] = previous
+            return mtime, previous[1]
+
+        return mtime, None
+
+    def record(self, root, mtime, listing):
+        """Record the contents of a directory.
+
+        Args:
+            root (str): The path to the directory.
+            mtime (int): The modification time of the directory before it was read.
+            listing (tuple(list(str), list(str))): The paths of the subdirectories
+                and the names of the files in the directory.
+        """
+        self.listings[root] = (mtime, listing)
+
+
+def _list_directory(root, ignore, follow_symlinks):
+    subdirectories = []
+    filenames = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir:
+                filenames.append(entry.name)
+            elif not follow_symlinks and entry.is_symlink():
+                continue
+            elif _path_matches_patterns(entry.path, ignore):
+                LOGGER.log(
+                    "VERBOSE",
+                    colorize("bold", "[AutoAPI] ")
+                    + colorize("darkgreen", f"Ignoring directory: {entry.path}/"),
+                )
+            else:
+                subdirectories.append(entry.path)
+
+    return subdirectories, filenames
+
+
+def _walk(top, ignore, follow_symlinks, listings=None):
+    """Walk a directory tree, pruning ignored directories before they are entered.
+
+    This yields directories in the same order as :func:`os.walk`.
+
+    Args:
+        top (str): The directory to walk.
+        ignore (re.Pattern or None): The compiled patterns of paths to ignore.
+        follow_symlinks (bool): Whether to walk into symlinked directories.
+        listings (_DirectoryListings or None): Where to reuse and record
+            the contents of directories.
+
+    Yields:
+        tuple(str, list(str)): The path to each directory
+        and the names of the files in it.
+    """
+    stack = [top]
+    while stack:
+        root = stack.pop()
+        try:
+            listing = None
+            if listings is not None:
+                mtime, listing = listings.lookup(root)
+
+            if listing is None:
+                listing = _list_directory(root, ignore, follow_symlinks)
+                if listings is not None:
+                    listings.record(root, mtime, listing)
+        except OSError:
+            continue
+
+        subdirectories, filenames = listing
+        yield root, filenames
+        stack.extend(reversed(subdirectories))
+
+
+class _SkipRules:
+    """A precompiled matcher for :confval:`autoapi_skip_rules`.
+
+    All of the patterns for each kind of rule are combined into
+    a single regular expression,
+    which is matched against a string of the form ``"<type>:<id>"``.
+
+    Args:
+        rules (dict(str, dict(str, list(str)))): A mapping of object types
+            to the ``"include"`` and ``"exclude"`` patterns for that type.
+    """
+
+    _KINDS = ("include", "exclude")
+
+    def __init__(self, rules):
+        sources = {kind: [] for kind in self._KINDS}
+        for type_, type_rules in rules.items():
+            if type_ != "*" and type_ not in Mapper._OBJ_MAP:
+                raise ExtensionError(
+                    f"Unknown object type '{type_}' in autoapi_skip_rules"
+                )
+            unknown = set(type_rules) - set(self._KINDS)
+            if unknown:
+                raise ExtensionError(
+                    f"Unknown rule kinds {sorted(unknown)} in autoapi_skip_rules"
+                )
+
+            type_re = "[^:]*" if type_ == "*" else re.escape(type_)
+            for kind in self._KINDS:
+                for pattern in type_rules.get(kind, ()):
+                    sources[kind].append(f"(?:{type_re}:{fnmatch.translate(pattern)})")
+
+        self._include = self._compile(sources["include"])
+        self._exclude = self._compile(sources["exclude"])
+
+    @staticmethod
+    def _compile(sources):
+        if not sources:
+            return None
+
+        return re.compile("|".join(sources))
+
+    def should_skip(self, type_, id_, skip):
+        """Apply the rules to an object.
+
+        Args:
+            type_ (str): The type of the object.
+            id_ (str): The fully qualified name of the object.
+            skip (bool): Whether the object would be skipped without the rules.
+
+        Returns:
+            bool: Whether the object should be skipped.
+        """
+        key = f"{type_}:{id_}"
+        if self._include and self._include.match(key):
+            return False
+
+        if self._exclude and self._exclude.match(key):
             return True
-    return False
+
+        return skip
 
 
 class Mapper:
@@ -305,62 +1004,55 @@ class Mapper:
             self.app.config.autoapi_python_use_implicit_namespaces
         )
         self._follow_symlinks = self.app.config.autoapi_follow_symlinks
+        # Mapping of {directory -> whether it is a regular package}
+        self._package_dirs = {}
+        self._base_summaries = None
+        self._docstring_cache = None
+        # Mapping of {docstring key -> docstring lines processed by parse workers}
+        self._processed_docstrings = {}
+        self._skip_rules = None
+        if self.app.config.autoapi_skip_rules:
+            self._skip_rules = _SkipRules(self.app.config.autoapi_skip_rules)
 
     @staticmethod
-    def find_files(patterns, dirs, ignore, follow_symlinks: bool):
-        if not ignore:
-            ignore = []
+    def find_files(patterns, dirs, ignore, follow_symlinks: bool, listings=None):
+        ignore_re = _compile_patterns(ignore)
 
         pattern_regexes = []
         for pattern in patterns:
             regex = re.compile(fnmatch.translate(pattern).replace(".*", "(.*)"))
-            pattern_regexes.append((pattern, regex))
+            pattern_regexes.append(regex)
 
         for _dir in dirs:  # iterate autoapi_dirs
-            for root, subdirectories, filenames in os.walk(
-                _dir, followlinks=follow_symlinks
-            ):
-                # skip directories if needed
-                for sub_dir in subdirectories.copy():
-                    # iterate copy as we adapt subdirectories during loop
-                    if _path_matches_patterns(os.path.join(root, sub_dir), ignore):
-                        LOGGER.info(
+            for root, filenames in _walk(_dir, ignore_re, follow_symlinks, listings):
+                # Files are yielded in order of the pattern that they match
+                matched: list[list[tuple[str, tuple[str, ...]]]] = [
+                    [] for _ in pattern_regexes
+                ]
+                for filename in filenames:
+                    for i, pattern_re in enumerate(pattern_regexes):
+                        match = pattern_re.match(filename)
+                        if match:
+                            matched[i].append((filename, match.groups()))
+
+                seen = set()
+                for filename, norm_name in itertools.chain.from_iterable(matched):
+                    if norm_name in seen:
+                        continue
+
+                    path = os.path.join(root, filename)
+
+                    # Skip ignored files
+                    if _path_matches_patterns(path, ignore_re):
+                        LOGGER.log(
+                            "VERBOSE",
                             colorize("bold", "[AutoAPI] ")
-                            + colorize(
-                                "darkgreen", f"Ignoring directory: {root}/{sub_dir}/"
-                            )
+                            + colorize("darkgreen", f"Ignoring file: {path}"),
                         )
-                        # adapt original subdirectories inplace
-                        subdirectories.remove(sub_dir)
-                # recurse into remaining directories
-                seen = set()
-                for pattern, pattern_re in pattern_regexes:
-                    for filename in fnmatch.filter(filenames, pattern):
-                        match = re.match(pattern_re, filename)
-                        if match is None:
-                            raise ValueError(
-                                f'Could not match pattern "{pattern_re}" to filename "{filename}".'
-                            )
-                        norm_name = match.groups()
-                        if norm_name in seen:
-                            continue
-
-                        # Skip ignored files
-                        if _path_matches_patterns(os.path.join(root, filename), ignore):
-                            LOGGER.info(
-                                colorize("bold", "[AutoAPI] ")
-                                + colorize(
-                                    "darkgreen", f"Ignoring file: {root}/{filename}"
-                                )
-                            )
-                            continue
-
-                        # Make sure the path is full
-                        if not os.path.isabs(filename):
-                            filename = os.path.join(root, filename)
-
-                        yield filename
-                        seen.add(norm_name)
+                        continue
+
+                    yield path
+                    seen.add(norm_name)
 
     def output_rst(self, source_suffix):
         for _, obj in status_iterator(
@@ -400,7 +1092,7 @@ class Mapper:
             content = self.jinja_env.get_template("index.rst")
             top_level_file.write(content.render(pages=pages).encode("utf-8"))
 
-    def _need_to_load(self, files):
+    def _need_to_load(self, files, parse_settings):
         last_files = getattr(self.app.env, "autoapi_source_files", [])
         self.app.env.autoapi_source_files = files
 
@@ -408,24 +1100,30 @@ class Mapper:
         this_mtime = max(os.path.getmtime(file) for _, file in files)
         self.app.env.autoapi_max_mtime = this_mtime
 
-        if not self.app.config.autoapi_keep_files:
-            return True
+        last_settings = getattr(self.app.env, "autoapi_parse_settings", None)
+        self.app.env.autoapi_parse_settings = parse_settings
 
-        if self.app.env.config_status != sphinx.environment.CONFIG_OK:
+        if last_settings != parse_settings:
             return True
 
         return (
             set(last_files) != set(files) or not last_mtime or last_mtime < this_mtime
         )
 
-    def _find_files(self, patterns, dirs, ignore):
+    def _need_to_render(self, render_settings):
+        last_settings = getattr(self.app.env, "autoapi_render_settings", None)
+        self.app.env.autoapi_render_settings = render_settings
+
+        # Rendered files are removed at the end of every build.
+        if not self.app.config.autoapi_keep_files:
+            return True
+
+        return last_settings != render_settings
+
+    def _find_files(self, patterns, dirs, ignore, listings=None):
         for dir_ in dirs:
             dir_root = dir_
-            if (
-                os.path.exists(os.path.join(dir_, "__init__.py"))
-                or os.path.exists(os.path.join(dir_, "__init__.pyi"))
-                or self._use_implicit_namespace
-            ):
+            if self._is_package_dir(dir_) or self._use_implicit_namespace:
                 dir_root = os.path.abspath(os.path.join(dir_, os.pardir))
 
             for path in self.find_files(
@@ -433,50 +1131,257 @@ class Mapper:
                 dirs=[dir_],
                 ignore=ignore,
                 follow_symlinks=self._follow_symlinks,
+                listings=listings,
             ):
                 yield dir_root, path
 
+    def _is_package_dir(self, directory):
+        if directory not in self._package_dirs:
+            self._package_dirs[directory] = is_package_dir(directory)
+
+        return self._package_dirs[directory]
+
+    def _get_module_name(self, path, dir_root):
+        if self._use_implicit_namespace:
+            return get_module_name(
+                path, lambda directory: os.path.abspath(directory) != dir_root
+            )
+
+        return get_module_name(path, self._is_package_dir)
+
     def load(self, patterns, dirs, ignore=None):
         """Load objects from the filesystem into the ``paths`` dictionary
 
         Also include an attribute on the object, ``relative_path`` which is the
         shortened, relative path the package/module
+
+        Source files are only read again when they, or the settings that
+        reading them depends on, have changed.
+        Otherwise the data read by the previous build is reused
+        if the settings that mapping and rendering depend on have changed.
+
+        Returns:
+            bool: Whether the loaded objects need to be mapped and rendered.
         """
-        dir_root_files = list(self._find_files(patterns, dirs, ignore))
+        start = time.perf_counter()
+        listings = _DirectoryListings(
+            (tuple(ignore or ()), self._follow_symlinks),
+            getattr(self.app.env, "autoapi_directory_listings", None),
+        )
+        dir_root_files = list(self._find_files(patterns, dirs, ignore, listings))
+        self.app.env.autoapi_directory_listings = listings
         if not dir_root_files:
             raise ExtensionError(f"No source files found in: {','.join(dirs)}")
 
-        if not self._need_to_load(dir_root_files):
-            LOGGER.debug(
-                "[AutoAPI] Skipping read stage because source files have not changed."
+        LOGGER.info(
+            colorize("bold", "[AutoAPI] ")
+            + colorize(
+                "darkgreen",
+                f"Found {len(dir_root_files)} source files"
+                f" in {time.perf_counter() - start:.2f}s",
             )
-            return False
+        )
 
-        for dir_root, path in status_iterator(
-            dir_root_files,
-            colorize("bold", "[AutoAPI] Reading files... "),
-            length=len(dir_root_files),
-            stringify_func=(lambda x: x[1]),
+        parse_settings = _get_parse_settings(self.app, patterns, dirs, ignore)
+        need_to_render = self._need_to_render(_get_render_settings(self.app))
+        parsed_data_path = os.path.join(self.app.doctreedir, "autoapi_parsed.pickle")
+        if not self._need_to_load(dir_root_files, parse_settings):
+            # The data that was read is only needed to render the objects again.
+            paths = {}
+            if need_to_render:
+                paths = load_pickle(parsed_data_path, parse_settings)
+
+            if paths is not None:
+                LOGGER.debug(
+                    "[AutoAPI] Skipping read stage because source files"
+                    " have not changed."
+                )
+                self.paths = paths
+                return need_to_render
+
+        # astroid and the parser are only imported once files need to be read,
+        # so that builds that reuse the environment do not pay for them.
+        import astroid
+
+        from ._parser import BaseSummaryCache
+
+        cache_dir = self.app.config.autoapi_base_summary_cache_dir
+        if cache_dir:
+            self._base_summaries = BaseSummaryCache(
+                os.path.join(self.app.srcdir, cache_dir),
+                dirs,
+                settings=(
+                    tuple(sorted(self.app.config.autoapi_inference_boundary)),
+                    self.app.config.autoapi_inference_budget,
+                ),
+            )
+
+        cached_modules = set(astroid.MANAGER.astroid_cache)
+        if (
+            self.app.config.autoapi_parallel_parse
+            and self.app.parallel > 1
+            and parallel_available
         ):
-            data = self.read_file(path=path, dir_root=dir_root)
+            results, stats = self._read_files_parallel(dir_root_files)
+        else:
+            results, stats = self._read_files(
+                status_iterator(
+                    dir_root_files,
+                    colorize("bold", "[AutoAPI] Reading files... "),
+                    length=len(dir_root_files),
+                    stringify_func=(lambda x: x[1]),
+                )
+            )
+
+        for (dir_root, path), data in zip(dir_root_files, results):
             if data:
                 data["relative_path"] = os.path.relpath(path, dir_root)
                 self.paths[path] = data
 
+        if self._base_summaries is not None:
+            self._base_summaries.save()
+
+        if self.app.config.autoapi_release_astroid_cache:
+            # Everything that is needed from the trees has been parsed by now.
+            for module_name in set(astroid.MANAGER.astroid_cache) - cached_modules:
+                del astroid.MANAGER.astroid_cache[module_name]
+
+        # Mapping changes the data, so keep a copy for builds
+        # that only need to map and render the objects again.
+        save_pickle(parsed_data_path, parse_settings, self.paths)
+
+        lookups = stats.hits + stats.misses
+        if lookups:
+            LOGGER.log(
+                "VERBOSE",
+                colorize("bold", "[AutoAPI] ")
+                + colorize(
+                    "darkgreen",
+                    f"Resolved {lookups} names,"
+                    f" {stats.hits / lookups:.0%} from the name cache",
+                ),
+            )
+
         return True
 
+    def _read_files(self, dir_root_files):
+        """Read the given files in the current process.
+
+        Args:
+            dir_root_files (iterable(tuple(str, str))): The root directory
+                and the path of each file to read.
+
+        Returns:
+            tuple(list(dict or None), QualnameCacheStats): The data of each file,
+            or ``None`` if a file could not be read,
+            and how often names were resolved from the name cache.
+        """
+        from . import _astroid_utils
+
+        _astroid_utils.clear_qualname_cache()
+        results = [
+            self.read_file(
+                path=path,
+                dir_root=dir_root,
+                module_name=self._get_module_name(path, dir_root),
+            )
+            for dir_root, path in dir_root_files
+        ]
+
+        return results, _astroid_utils.clear_qualname_cache()
+
+    def _read_files_parallel(self, dir_root_files):
+        """Read the given files across a pool of worker processes.
+
+        Each worker reads a chunk of the files.
+        The results of a chunk are collected as soon as it has been read,
+        but imports are only resolved once every chunk has been read.
+        When every ``autodoc-process-docstring`` handler is pure,
+        the workers also process the docstrings of the objects that they read.
+        The base class summaries added by the workers are merged
+        into :attr:`_base_summaries`, to be saved once by the main process.
+
+        Args:
+            dir_root_files (list(tuple(str, str))): The root directory
+                and the path of each file to read.
+
+        Returns:
+            tuple(list(dict or None), QualnameCacheStats): The data of each file,
+            or ``None`` if a file could not be read,
+            and how often names were resolved from the name cache.
+        """
+        from . import _astroid_utils
+
+        nproc = self.app.parallel
+        chunks = make_chunks(dir_root_files, nproc)
+        # Mapping of {chunk index -> data of each file in the chunk}
+        results = {}
+        hits = misses = 0
+
+        def _on_chunk_read(chunk_index, result):
+            nonlocal hits, misses
+            results[chunk_index], stats, processed_docstrings, summaries = result
+            hits += stats.hits
+            misses += stats.misses
+            self._processed_docstrings.update(processed_docstrings)
+            if self._base_summaries is not None:
+                self._base_summaries.update(summaries)
+
+        process_docstrings = _are_docstring_handlers_pure(self.app)
+
+        def _read_chunk(chunk_index):
+            results, stats = self._read_files(chunks[chunk_index])
+            summaries = {}
+            if self._base_summaries is not None:
+                summaries = self._base_summaries.modified
+
+            processed_docstrings = {}
+            if process_docstrings:
+                self._docstring_cache = self._load_docstring_cache()
+                for data in results:
+                    if data:
+                        self._preprocess_docstrings(data)
+                processed_docstrings = self._docstring_cache.entries
+
+            return results, stats, processed_docstrings, summaries
+
+        tasks = ParallelTasks(nproc)
+        for chunk_index, chunk in status_iterator(
+            enumerate(chunks),
+            colorize("bold", "[AutoAPI] Reading files... "),
+            length=len(chunks),
+            stringify_func=(lambda x: f"{len(x[1])} files"),
+        ):
+            tasks.add_task(_read_chunk, chunk_index, _on_chunk_read)
+        tasks.join()
+
+        return (
+            list(itertools.chain.from_iterable(results[i] for i in range(len(chunks)))),
+            _astroid_utils.QualnameCacheStats(hits, misses),
+        )
+
     def read_file(self, path, **kwargs):
         """Read file input into memory, returning deserialized objects
 
         Args:
             path: Path of file to read
         """
+        from ._parser import Parser
+
         dir_root = kwargs.get("dir_root")
+        module_name = kwargs.get("module_name")
+        parser = Parser(
+            inference_boundary=self.app.config.autoapi_inference_boundary,
+            inference_budget=self.app.config.autoapi_inference_budget,
+            base_summaries=self._base_summaries,
+        )
         try:
             if self._use_implicit_namespace:
-                parsed_data = Parser().parse_file_in_namespace(path, dir_root)
+                parsed_data = parser.parse_file_in_namespace(
+                    path, dir_root, module_name
+                )
             else:
-                parsed_data = Parser().parse_file(path)
+                parsed_data = parser.parse_file(path, module_name)
             return parsed_data
         except (OSError, TypeError, ImportError):
             LOGGER.debug("Reason:", exc_info=True)
@@ -488,68 +1393,187 @@ class Mapper:
         return None
 
     def _skip_if_stdlib(self):
+        """Create a visitor that hides members inherited from the standard library.
+
+        Returns:
+            callable: The visitor. See :func:`_visit_tree`.
+        """
         documented_modules = {obj["full_name"] for obj in self.paths.values()}
+        # Mapping of {id(class data) -> class data without its children}
+        inherited_from = {}
+
+        def _visit(module, parent, obj, path):
+            if not obj.get("inherited", False):
+                return
 
-        q = collections.deque(self.paths.values())
-        while q:
-            obj = q.popleft()
-            if "children" in obj:
-                q.extend(obj["children"])
-
-            if obj.get("inherited", False):
-                module = obj["inherited_from"]["full_name"].split(".", 1)[0]
-                if (
-                    module in sys.stdlib_module_names
-                    and not obj["inherited_from"]["is_abstract"]
-                    and module not in documented_modules
-                ):
-                    obj["hide"] = True
+            inherited_module = obj["inherited_from"]["full_name"].split(".", 1)[0]
+            if (
+                inherited_module in sys.stdlib_module_names
+                and not obj["inherited_from"]["is_abstract"]
+                and inherited_module not in documented_modules
+            ):
+                obj["hide"] = True
+
+            # Nothing needs the members of the class that a member
+            # is inherited from after this point,
+            # so stop them from being kept alive by every inherited member.
+            key = id(obj["inherited_from"])
+            if key not in inherited_from:
+                inherited_from[key] = {
+                    name: value
+                    for name, value in obj["inherited_from"].items()
+                    if name != "children"
+                }
+            obj["inherited_from"] = inherited_from[key]
+
+        return _visit
 
     def _resolve_placeholders(self):
-        """Resolve objects that have been imported from elsewhere."""
+        """Resolve objects that have been imported from elsewhere.
+
+        Modules are removed from ``paths`` as soon as
+        no other module needs them to resolve its own placeholders.
+
+        Yields:
+            tuple(str, dict): The path and the data of each module,
+            once it has been released.
+        """
+        # Mapping of {id(module data) -> the path that it was read from}
+        module_paths = {id(module): path for path, module in self.paths.items()}
         modules = {}
+        unresolved = []
         for module in self.paths.values():
+            if module["name"] in modules:
+                # Only the last module of the same name can be imported from.
+                unresolved.append(modules[module["name"]][0])
             children = {child["name"]: child for child in module["children"]}
             modules[module["name"]] = (module, children)
+        self.paths.clear()
 
-        resolved = set()
-        for module_name in modules:
-            visit_path = collections.OrderedDict()
-            _resolve_module_placeholders(modules, module_name, visit_path, resolved)
+        # Mapping of {module name -> the names of the modules that it imports from}
+        imports = _get_import_graph(modules)
+        # Mapping of {module name -> the number of unresolved modules importing it}
+        importers = collections.Counter()
+        for module_name, imported_from in imports.items():
+            importers.update(name for name in imported_from if name != module_name)
 
-    def _hide_yo_kids(self):
+        resolved = set()
+        released = []
+        # Mapping of {module name -> the objects that a wildcard import imports}
+        exports = {}
+
+        def _release(module_name):
+            if module_name in resolved and not importers[module_name]:
+                released.append(modules.pop(module_name)[0])
+                exports.pop(module_name, None)
+
+        # Modules are resolved after every module that they import from.
+        for component in _strongly_connected_components(imports):
+            _resolve_component_placeholders(modules, component, exports)
+            resolved.update(component)
+            for module_name in component:
+                for imported_from in imports[module_name]:
+                    if imported_from != module_name:
+                        importers[imported_from] -= 1
+                        _release(imported_from)
+                _release(module_name)
+
+            for module in released:
+                yield module_paths[id(module)], module
+            released.clear()
+
+        # Every module has been resolved, so nothing is importing what is left.
+        for module, _ in modules.values():
+            yield module_paths[id(module)], module
+        for module in unresolved:
+            yield module_paths[id(module)], module
+
+    def _hide_yo_kids(self, module):
         """For all direct children of a module/package, hide them if needed."""
-        for module in self.paths.values():
-            if module["all"] is not None:
-                all_names = set(module["all"])
-                for child in module["children"]:
-                    if child["qual_name"] not in all_names:
-                        child["hide"] = True
-            elif module["type"] == "module":
-                for child in module["children"]:
-                    if "original_path" in child:
-                        child["hide"] = True
+        if module["all"] is not None:
+            all_names = set(module["all"])
+            for child in module["children"]:
+                if child["qual_name"] not in all_names:
+                    child["hide"] = True
+        elif module["type"] == "module":
+            for child in module["children"]:
+                if "original_path" in child:
+                    child["hide"] = True
+
+    @contextlib.contextmanager
+    def _timed_pass(self, name):
+        start = time.perf_counter()
+        yield
+        LOGGER.log(
+            "VERBOSE",
+            colorize("bold", "[AutoAPI] ")
+            + colorize("darkgreen", f"{name} took {time.perf_counter() - start:.2f}s"),
+        )
 
     def map(self, options=None):
-        self._skip_if_stdlib()
-        self._resolve_placeholders()
-        self._hide_yo_kids()
+        # Inherited members are checked before placeholders are resolved,
+        # so that imported copies of a class are already checked.
+        with self._timed_pass("Checking inherited members"):
+            _visit_data(list(self.paths.values()), [self._skip_if_stdlib()])
+
         self.app.env.autoapi_annotations = {}
 
-        for _, data in status_iterator(
-            self.paths.items(),
-            colorize("bold", "[AutoAPI] ") + "Mapping Data... ",
-            length=len(self.paths),
-            stringify_func=(lambda x: x[0]),
-        ):
-            for obj in self.create_class(data, options=options):
-                self.all_objects[obj.id] = obj
+        if self.app.config.autoapi_docstring_cache_dir or self._processed_docstrings:
+            self._docstring_cache = self._load_docstring_cache()
+            self._docstring_cache.update(self._processed_docstrings)
+            self._processed_docstrings = {}
+
+        with self._timed_pass("Mapping data"):
+            # Objects are stored in the order that modules were read,
+            # regardless of the order that they are mapped in,
+            # so that the last module read wins when module names are the same.
+            module_order = list(self.paths)
+            module_objects = {}
+            for path, data in status_iterator(
+                self._resolve_placeholders(),
+                colorize("bold", "[AutoAPI] ") + "Mapping Data... ",
+                length=len(self.paths),
+                stringify_func=(lambda x: x[1]["name"]),
+            ):
+                # Other modules can copy the children of a module
+                # when resolving placeholders, so only hide children of modules
+                # that no other module needs.
+                self._hide_yo_kids(data)
+                module_objects[path] = list(self.create_class(data, options=options))
+
+            viewcode_locations = {}
+            for path in module_order:
+                for obj in module_objects.pop(path):
+                    self.all_objects[obj.id] = obj
+                    if isinstance(obj, (PythonModule, PythonPackage)):
+                        viewcode_locations[obj.id] = {}
+
+        if self._docstring_cache is not None:
+            self._docstring_cache.save()
+            LOGGER.log(
+                "VERBOSE",
+                colorize("bold", "[AutoAPI] ")
+                + colorize(
+                    "darkgreen",
+                    f"Reused {self._docstring_cache.hits} processed docstrings",
+                ),
+            )
 
-        self._create_module_hierarchy()
-        self._render_selection()
+        with self._timed_pass("Selecting objects to render"):
+            # Only the top level objects are in ``all_objects`` at this point.
+            # They are the roots of the single pass over every other object,
+            # so they cannot be visited by it.
+            # Building the hierarchy needs every module to have been mapped,
+            # and the pass needs the hierarchy to know which modules are hidden.
+            self._create_module_hierarchy()
+            self._render_selection(
+                visitors=[_viewcode_location_visitor(viewcode_locations)]
+            )
 
         self.app.env.autoapi_objects = self.objects_to_render
         self.app.env.autoapi_all_objects = self.all_objects
+        self.app.env.autoapi_inheritance_graphs = {}
+        self.app.env.autoapi_viewcode_locations = viewcode_locations
 
     def _create_module_hierarchy(self) -> None:
         """Populate the sub{module,package}s attributes of all top level objects."""
@@ -564,8 +1588,19 @@ class Mapper:
             obj.submodules.sort()
             obj.subpackages.sort()
 
-    def _render_selection(self):
-        """Propagate display values to children."""
+    def _render_selection(self, visitors=()):
+        """Propagate display values to children.
+
+        This also records the displayed children of each object.
+
+        Args:
+            visitors (list(callable)): Also call these on each descendant
+                of the top level objects, in the same pass.
+                See :func:`_visit_tree`.
+        """
+        # Packages are visited before their submodules so that hiding a package
+        # hides everything under it, before the pass over the descendants
+        # of each module checks whether their parent is displayed.
         for obj in sorted(self.all_objects.values(), key=lambda obj: len(obj.id)):
             if obj.display:
                 assert obj.type in self.own_page_types
@@ -574,19 +1609,17 @@ class Mapper:
                 for module in itertools.chain(obj.subpackages, obj.submodules):
                     module.obj["hide"] = True
 
-        def _inner(parent):
-            for child in parent.children:
-                self.all_objects[child.id] = child
-                if not parent.display:
-                    child.obj["hide"] = True
+        def _visit(root, parent, child, path):
+            self.all_objects[child.id] = child
+            if not parent.display:
+                child.obj["hide"] = True
 
-                if child.display and child.type in self.own_page_types:
+            if child.display:
+                parent._add_visible_child(child)
+                if child.type in self.own_page_types:
                     self.objects_to_render[child.id] = child
 
-                _inner(child)
-
-        for obj in list(self.all_objects.values()):
-            _inner(obj)
+        _visit_objects(list(self.all_objects.values()), [_visit, *visitors])
 
     def create_class(self, data, options=None):
         """Create a class from the passed in data
@@ -607,11 +1640,12 @@ class Mapper:
                 jinja_env=self.jinja_env,
                 app=self.app,
                 url_root=self.url_root,
+                skip_rules=self._skip_rules,
             )
 
             for child_data in data.get("children", []):
                 for child_obj in self.create_class(child_data, options=options):
-                    obj.children.append(child_obj)
+                    obj.add_child(child_obj)
 
             # Some objects require children to establish their docstring
             # or type annotations (eg classes with inheritance),
@@ -621,25 +1655,87 @@ class Mapper:
                 # Add back the trailing newline that .splitlines removes
                 lines.append("")
                 if "autodoc-process-docstring" in self.app.events.events:
-                    self.app.emit(
-                        "autodoc-process-docstring",
-                        cls.type,
-                        obj.name,
-                        None,
-                        None,
-                        lines,
-                    )
+                    lines = self._process_docstring(cls.type, obj.name, lines)
             obj.docstring = "\n".join(lines)
             self._record_typehints(obj)
 
             # Parser gives children in source order already
             if self.app.config.autoapi_member_order == "alphabetical":
-                obj.children.sort(key=operator.attrgetter("name"))
+                obj.sort_children(key=operator.attrgetter("name"))
             elif self.app.config.autoapi_member_order == "groupwise":
-                obj.children.sort(key=lambda x: (x.member_order, x.name))
+                obj.sort_children(key=lambda x: (x.member_order, x.name))
 
             yield obj
 
+    def _load_docstring_cache(self):
+        """Load the processed docstrings from previous builds.
+
+        Returns:
+            _DocstringCache: The cache. This keeps docstrings only in memory
+            when :confval:`autoapi_docstring_cache_dir` is not set.
+        """
+        cache_dir = self.app.config.autoapi_docstring_cache_dir
+        if not cache_dir:
+            return _DocstringCache(None, "")
+
+        return _DocstringCache(
+            os.path.join(self.app.srcdir, cache_dir, "docstrings.pickle"),
+            _get_docstring_settings(self.app),
+        )
+
+    def _preprocess_docstrings(self, data):
+        """Process the docstrings that mapping a module will process.
+
+        Class docstrings are processed only when they are not combined
+        with the docstring of the constructor,
+        because the constructor docstring is processed first.
+
+        Args:
+            data (dict): The parsed data of the module.
+        """
+
+        def _visit(root, parent, obj, path):
+            cls = self._OBJ_MAP.get(obj["type"])
+            if cls is None or not obj.get("doc"):
+                return
+
+            if issubclass(cls, PythonClass) and (
+                self.app.config.autoapi_python_class_content != "class"
+            ):
+                return
+
+            lines = obj["doc"].splitlines()
+            lines.append("")
+            self._process_docstring(cls.type, obj["name"], lines)
+
+        _visit(data, None, data, data["name"])
+        _visit_data([data], [_visit])
+
+    def _process_docstring(self, what, name, lines):
+        """Process a docstring with the ``autodoc-process-docstring`` handlers.
+
+        Args:
+            what (str): The type of the object that the docstring belongs to.
+            name (str): The name of the object that the docstring belongs to.
+            lines (list(str)): The lines of the docstring.
+
+        Returns:
+            list(str): The processed lines.
+        """
+        if self._docstring_cache is None:
+            self.app.emit("autodoc-process-docstring", what, name, None, None, lines)
+            return lines
+
+        processed = self._docstring_cache.get(what, name, lines)
+        if processed is None:
+            processed = list(lines)
+            self.app.emit(
+                "autodoc-process-docstring", what, name, None, None, processed
+            )
+            self._docstring_cache.add(what, name, lines, processed)
+
+        return processed
+
     def _record_typehints(self, obj):
         if (
             isinstance(obj, (PythonClass, PythonFunction, PythonMethod))
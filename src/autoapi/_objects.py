@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import functools
+from collections.abc import Callable
 import pathlib
+from typing import Any
 
 import sphinx
 import sphinx.util
@@ -44,7 +45,14 @@ class PythonObject:
     type: str
 
     def __init__(
-        self, obj, jinja_env, app, url_root, options=None, class_content="class"
+        self,
+        obj,
+        jinja_env,
+        app,
+        url_root,
+        options=None,
+        class_content="class",
+        skip_rules=None,
     ):
         self.app = app
         self.obj = obj
@@ -65,11 +73,18 @@ class PythonObject:
         This is the same as the fully qualified name of the object.
         """
 
-        self.children: list[PythonObject] = []
-        """The members of this object.
+        self._children: list[PythonObject] = []
+        # The members of this object by name and by type.
+        # Built on first use and discarded whenever the members change.
+        self._child_index: (
+            tuple[dict[str, PythonObject], dict[str, list[PythonObject]]] | None
+        ) = None
+        self.visible_children: list[PythonObject] = []
+        """The members of this object that are displayed, in order.
 
-        For example, the classes and functions defined in the parent module.
+        This is populated once AutoAPI has decided which objects to render.
         """
+        self._visible_children_by_type: dict[str, list[PythonObject]] = {}
         self._docstring: str = obj["doc"]
         self.imported: bool = "original_path" in obj
         """Whether this object was imported from another module."""
@@ -78,6 +93,7 @@ class PythonObject:
 
         # For later
         self._class_content = class_content
+        self._skip_rules = skip_rules
         self._display_cache: bool | None = None
 
     def __getstate__(self):
@@ -197,10 +213,14 @@ class PythonObject:
         """Whether this object should be displayed in documentation.
 
         This attribute depends on the configuration options given in
-        :confval:`autoapi_options` and the result of :event:`autoapi-skip-member`.
+        :confval:`autoapi_options`, the rules in :confval:`autoapi_skip_rules`,
+        and the result of :event:`autoapi-skip-member`.
         """
         if self._display_cache is None:
-            self._display_cache = not self._ask_ignore(self._should_skip())
+            skip = self._should_skip()
+            if self._skip_rules is not None:
+                skip = self._skip_rules.should_skip(self.type, self.id, skip)
+            self._display_cache = not self._ask_ignore(skip)
 
         return self._display_cache
 
@@ -247,8 +267,85 @@ class PythonObject:
 
         return ask_result if ask_result is not None else skip
 
+    @property
+    def children(self) -> list[PythonObject]:
+        """The members of this object.
+
+        For example, the classes and functions defined in the parent module.
+        Use :meth:`add_child` and :meth:`sort_children` to change the members,
+        so that lookups of members stay up to date.
+        """
+        return self._children
+
+    @children.setter
+    def children(self, value: list[PythonObject]) -> None:
+        self._children = value
+        self._children_changed()
+
+    def add_child(self, child: PythonObject) -> None:
+        """Add a member to this object.
+
+        Args:
+            child: The member to add.
+        """
+        self._children.append(child)
+        self._children_changed()
+
+    def sort_children(self, key: Callable[[PythonObject], Any]) -> None:
+        """Sort the members of this object.
+
+        Args:
+            key: Called with each member to get the value to sort it by.
+        """
+        self._children.sort(key=key)
+        self._children_changed()
+
+    def _children_changed(self) -> None:
+        """Discard everything that was derived from the members of this object."""
+        self._child_index = None
+
+    def _get_child_index(
+        self,
+    ) -> tuple[dict[str, PythonObject], dict[str, list[PythonObject]]]:
+        if self._child_index is None:
+            by_name: dict[str, PythonObject] = {}
+            by_type: dict[str, list[PythonObject]] = {}
+            for child in self._children:
+                by_name.setdefault(child.name, child)
+                by_type.setdefault(child.type, []).append(child)
+            self._child_index = (by_name, by_type)
+
+        return self._child_index
+
+    def get_child(self, name: str) -> PythonObject | None:
+        """Get a member of this object by name.
+
+        Args:
+            name: The name of the member, as named in the parsed source code.
+
+        Returns:
+            The first member with the given name,
+            or ``None`` if this object has no such member.
+        """
+        return self._get_child_index()[0].get(name)
+
     def _children_of_type(self, type_: str) -> list[PythonObject]:
-        return [child for child in self.children if child.type == type_]
+        return list(self._get_child_index()[1].get(type_, ()))
+
+    def visible_children_of_type(self, type_: str) -> list[PythonObject]:
+        """Get the members of this object of a given type that are displayed.
+
+        Args:
+            type_: The type of the members to get, such as ``"class"``.
+
+        Returns:
+            The displayed members of the given type, in order.
+        """
+        return self._visible_children_by_type.get(type_, [])
+
+    def _add_visible_child(self, child: PythonObject) -> None:
+        self.visible_children.append(child)
+        self._visible_children_by_type.setdefault(child.type, []).append(child)
 
 
 class PythonFunction(PythonObject):
@@ -447,10 +544,33 @@ class PythonClass(PythonObject):
         """The :pep:`695` type parameters of this class, formatted as a string."""
 
         self._docstring_resolved: bool = False
+        self._derived: dict[str, Any] = {}
+
+    def _children_changed(self) -> None:
+        super()._children_changed()
+        self._derived = {}
+
+    def _get_derived(self, name: str, derive: Callable[[], Any]) -> Any:
+        """Get a value that is derived from the members or docstring of this class.
+
+        Values are stored on the instance until the members change
+        or the docstring is reassigned.
+
+        Args:
+            name: The name to store the value under.
+            derive: Called to derive the value when it is not stored.
+        """
+        if name not in self._derived:
+            self._derived[name] = derive()
+
+        return self._derived[name]
 
     @property
     def args(self) -> str:
         """The arguments to this object, formatted as a string."""
+        return self._get_derived("args", self._derive_args)
+
+    def _derive_args(self) -> str:
         args = ""
 
         if self.constructor:
@@ -467,6 +587,9 @@ class PythonClass(PythonObject):
 
     @property
     def overloads(self) -> list[tuple[str, str]]:
+        return self._get_derived("overloads", self._derive_overloads)
+
+    def _derive_overloads(self) -> list[tuple[str, str]]:
         overloads = []
 
         if self.constructor:
@@ -487,6 +610,16 @@ class PythonClass(PythonObject):
 
     @property
     def docstring(self) -> str:
+        return self._get_derived("docstring", self._derive_docstring)
+
+    @docstring.setter
+    def docstring(self, value: str) -> None:
+        self._docstring = value
+        self._docstring_resolved = True
+        self._derived.pop("docstring", None)
+        self._derived.pop("summary", None)
+
+    def _derive_docstring(self) -> str:
         docstring = self._docstring
 
         if not self._docstring_resolved and self._class_content in ("both", "init"):
@@ -500,10 +633,12 @@ class PythonClass(PythonObject):
 
         return docstring
 
-    @docstring.setter
-    def docstring(self, value: str) -> None:
-        self._docstring = value
-        self._docstring_resolved = True
+    @property
+    def summary(self) -> str:
+        return self._get_derived("summary", self._derive_summary)
+
+    def _derive_summary(self) -> str:
+        return super().summary
 
     @property
     def methods(self):
@@ -522,14 +657,13 @@ class PythonClass(PythonObject):
         return self._children_of_type("class")
 
     @property
-    @functools.lru_cache
     def constructor(self):
-        for child in self.children:
-            if child.short_name == "__init__":
-                if not child.type == "method":
-                    break
+        return self._get_derived("constructor", self._derive_constructor)
 
-                return child
+    def _derive_constructor(self):
+        child = self.get_child("__init__")
+        if child is not None and child.type == "method":
+            return child
 
         return None
 
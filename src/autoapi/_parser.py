@@ -1,23 +1,257 @@
-import collections
+import copy
+import importlib.metadata
+import itertools
 import os
+import types
 
 import astroid
+import astroid.bases
 from astroid.builder import AstroidBuilder
 from astroid.manager import AstroidManager
 import sphinx.util.docstrings
 
 from . import _astroid_utils
+from ._cache import load_pickle, save_pickle
+from ._paths import get_module_name, is_package_dir
 
 
 def _prepare_docstring(doc):
     return "\n".join(sphinx.util.docstrings.prepare_docstring(doc))
 
 
+# Increment when the format of parsed class data changes,
+# to stop summaries cached by an older version from being used.
+_SUMMARY_FORMAT = 1
+_IGNORED_ANCESTORS = ("__builtins__.object", "builtins.object", "builtins.type")
+_EXCEPTION_CLASSES = ("builtins.Exception", "builtins.BaseException")
+# Nodes that cannot contain anything to document,
+# so there is no need to look through their children.
+_UNDOCUMENTED_NODES = frozenset(
+    (
+        astroid.nodes.Assert,
+        astroid.nodes.Attribute,
+        astroid.nodes.AugAssign,
+        astroid.nodes.BinOp,
+        astroid.nodes.BoolOp,
+        astroid.nodes.Break,
+        astroid.nodes.Call,
+        astroid.nodes.Compare,
+        astroid.nodes.Const,
+        astroid.nodes.Continue,
+        astroid.nodes.Delete,
+        astroid.nodes.Dict,
+        astroid.nodes.Expr,
+        astroid.nodes.Global,
+        astroid.nodes.IfExp,
+        astroid.nodes.Import,
+        astroid.nodes.ImportFrom,
+        astroid.nodes.JoinedStr,
+        astroid.nodes.Lambda,
+        astroid.nodes.List,
+        astroid.nodes.Name,
+        astroid.nodes.Nonlocal,
+        astroid.nodes.Pass,
+        astroid.nodes.Raise,
+        astroid.nodes.Return,
+        astroid.nodes.Set,
+        astroid.nodes.Subscript,
+        astroid.nodes.Tuple,
+        astroid.nodes.UnaryOp,
+    )
+)
+
+
+class BaseSummaryCache:
+    """A persistent cache of the parsed data of classes from installed distributions.
+
+    The summaries of each distribution are stored in their own file,
+    keyed by the name and version of the distribution,
+    so that a distribution is analysed again only when its version changes.
+
+    Args:
+        cache_dir (str): The directory to store summaries in.
+        local_dirs (iterable(str)): The directories of the documented source code.
+            Classes defined in these directories are never cached.
+        settings (tuple): The settings that parsed data depends on.
+            Summaries cached with different settings are ignored.
+    """
+
+    def __init__(self, cache_dir, local_dirs=(), settings=()):
+        self._cache_dir = cache_dir
+        self._local_dirs = tuple(
+            os.path.join(os.path.abspath(local_dir), "") for local_dir in local_dirs
+        )
+        self._settings = (_SUMMARY_FORMAT, settings)
+        self._top_level_distributions = None
+        # Mapping of {top level name -> (distribution name, version) or None}
+        self._distributions = {}
+        # Mapping of {(distribution name, version) -> {class name -> summary}}
+        self._summaries = {}
+        self._modified = set()
+
+    def _get_distribution(self, name):
+        top_level = name.split(".", 1)[0]
+        if top_level not in self._distributions:
+            if self._top_level_distributions is None:
+                self._top_level_distributions = (
+                    importlib.metadata.packages_distributions()
+                )
+
+            distribution = None
+            dist_names = self._top_level_distributions.get(top_level)
+            if dist_names:
+                try:
+                    version = importlib.metadata.version(dist_names[0])
+                except importlib.metadata.PackageNotFoundError:
+                    pass
+                else:
+                    distribution = (dist_names[0], version)
+
+            self._distributions[top_level] = distribution
+
+        return self._distributions[top_level]
+
+    def _get_path(self, distribution):
+        return os.path.join(self._cache_dir, "{}-{}.pickle".format(*distribution))
+
+    def _get_summaries(self, distribution):
+        summaries = self._summaries.get(distribution)
+        if summaries is None:
+            summaries = load_pickle(self._get_path(distribution), self._settings)
+            if summaries is None:
+                summaries = {}
+
+            self._summaries[distribution] = summaries
+
+        return summaries
+
+    def get(self, name):
+        """Get the summary of a class.
+
+        Args:
+            name (str): The fully qualified name that the class is referenced by.
+
+        Returns:
+            tuple or None: The summary of the class,
+            or None if the class has not been summarised.
+        """
+        distribution = self._get_distribution(name)
+        if distribution is None:
+            return None
+
+        return self._get_summaries(distribution).get(name)
+
+    def is_external(self, node):
+        """Check whether a class can be summarised.
+
+        Args:
+            node (astroid.nodes.ClassDef): The class to check.
+
+        Returns:
+            bool: True if the class is defined by an installed distribution
+            outside of the documented source code, False otherwise.
+        """
+        module = node.root()
+        if not module.file or os.path.abspath(module.file).startswith(self._local_dirs):
+            return False
+
+        return self._get_distribution(module.name) is not None
+
+    def add(self, summary, names):
+        """Store the summary of a class.
+
+        Args:
+            summary (tuple): The summary to store.
+            names (iterable(str)): The fully qualified names
+                that the class is referenced by.
+        """
+        distribution = self._get_distribution(summary[0][0]["full_name"])
+        summaries = self._get_summaries(distribution)
+        for name in names:
+            # A name re-exported by another distribution is stored with
+            # that distribution only if both distributions are the same.
+            if not name or summaries.get(name) is summary:
+                continue
+            if self._get_distribution(name) == distribution:
+                summaries[name] = summary
+                self._modified.add(distribution)
+
+    @property
+    def modified(self):
+        """dict(tuple(str, str), dict(str, tuple)): The unsaved summaries by distribution."""
+        return {
+            distribution: self._summaries[distribution]
+            for distribution in self._modified
+        }
+
+    def update(self, modified):
+        """Store summaries that were added elsewhere, such as in another process.
+
+        Args:
+            modified (dict(tuple(str, str), dict(str, tuple))): The summaries,
+                as given by :attr:`modified`.
+        """
+        for distribution, summaries in modified.items():
+            self._get_summaries(distribution).update(summaries)
+            self._modified.add(distribution)
+
+    def save(self):
+        """Write the summaries that have changed to disk."""
+        for distribution in self._modified:
+            save_pickle(
+                self._get_path(distribution),
+                self._settings,
+                self._summaries[distribution],
+            )
+
+        self._modified.clear()
+
+
+def _replace_name_prefix(name, old_prefix, new_prefix):
+    suffix = name[len(old_prefix) :] if old_prefix else f".{name}"
+    return new_prefix + suffix if new_prefix else suffix[1:]
+
+
+def _has_abstract_methods(*mro_data):
+    seen = set()
+    for cls_data in mro_data:
+        for child_data in cls_data["children"]:
+            if child_data["type"] not in ("method", "property"):
+                continue
+            if child_data["name"] in seen:
+                continue
+
+            seen.add(child_data["name"])
+            if "abstractmethod" in child_data["properties"]:
+                return True
+
+    return False
+
+
 class Parser:
-    def __init__(self):
+    """Parse the astroid tree of a module into dictionaries.
+
+    Args:
+        inference_boundary (iterable(str)): The names of top level packages
+            that base classes are not inferred from.
+        inference_budget (int or None): The maximum number of base classes
+            to infer when resolving the ancestors of a class.
+        base_summaries (BaseSummaryCache or None): Where to reuse and store
+            the parsed data of classes from installed distributions.
+    """
+
+    def __init__(
+        self, inference_boundary=(), inference_budget=None, base_summaries=None
+    ):
         self._qual_name_stack = []
         self._full_name_stack = []
         self._encoding = None
+        self._boundary = frozenset(inference_boundary)
+        self._budget = inference_budget
+        self._base_summaries = base_summaries
+        # Mapping of {class name -> summary} of ancestors parsed from this file
+        self._parsed_ancestors = {}
+        self._parsing_ancestors = set()
 
     def _get_qual_name(self, name):
         return ".".join(self._qual_name_stack + [name])
@@ -25,34 +259,21 @@ class Parser:
     def _get_full_name(self, name):
         return ".".join(self._full_name_stack + [name])
 
-    def _parse_file(self, file_path, condition):
-        directory, filename = os.path.split(file_path)
-        module_parts = []
-        if filename != "__init__.py" and filename != "__init__.pyi":
-            module_part = os.path.splitext(filename)[0]
-            module_parts = [module_part]
-        module_parts = collections.deque(module_parts)
-        while directory and condition(directory):
-            directory, module_part = os.path.split(directory)
-            if module_part:
-                module_parts.appendleft(module_part)
-
-        module_name = ".".join(module_parts)
+    def _parse_file(self, file_path, condition, module_name=None):
+        if module_name is None:
+            module_name = get_module_name(file_path, condition)
+
         node = AstroidBuilder(AstroidManager()).file_build(file_path, module_name)
         return self.parse(node)
 
-    def parse_file(self, file_path):
-        return self._parse_file(
-            file_path,
-            lambda directory: (
-                os.path.isfile(os.path.join(directory, "__init__.py"))
-                or os.path.isfile(os.path.join(directory, "__init__.pyi"))
-            ),
-        )
+    def parse_file(self, file_path, module_name=None):
+        return self._parse_file(file_path, is_package_dir, module_name)
 
-    def parse_file_in_namespace(self, file_path, dir_root):
+    def parse_file_in_namespace(self, file_path, dir_root, module_name=None):
         return self._parse_file(
-            file_path, lambda directory: os.path.abspath(directory) != dir_root
+            file_path,
+            lambda directory: os.path.abspath(directory) != dir_root,
+            module_name,
         )
 
     def parse_annassign(self, node):
@@ -156,7 +377,7 @@ class Parser:
 
         return [data]
 
-    def _parse_classdef(self, node, use_name_stacks):
+    def _parse_classdef(self, node, use_name_stacks, ancestors=None):
         if use_name_stacks:
             qual_name = self._get_qual_name(node.name)
             full_name = self._get_full_name(node.name)
@@ -167,22 +388,31 @@ class Parser:
             qual_name = node.qname()[len(node.root().qname()) + 1 :]
             full_name = node.qname()
 
-        type_ = "class"
-        if _astroid_utils.is_exception(node):
-            type_ = "exception"
+        if ancestors is None:
+            is_exception = _astroid_utils.is_exception(
+                node, self._boundary, self._budget
+            )
+            doc = _astroid_utils.get_class_docstring(node, self._boundary, self._budget)
+        else:
+            is_exception = any(
+                name in _EXCEPTION_CLASSES
+                for name in itertools.chain(
+                    [node.qname()], (ancestor["full_name"] for ancestor in ancestors)
+                )
+            )
+            doc = node.doc_node.value if node.doc_node else ""
 
         data = {
-            "type": type_,
+            "type": "exception" if is_exception else "class",
             "name": node.name,
             "qual_name": qual_name,
             "full_name": full_name,
             "type_params": _astroid_utils.get_type_params_info(node.type_params),
             "bases": list(_astroid_utils.get_full_basenames(node)),
-            "doc": _prepare_docstring(_astroid_utils.get_class_docstring(node)),
+            "doc": _prepare_docstring(doc),
             "from_line_no": node.fromlineno,
             "to_line_no": node.tolineno,
             "children": [],
-            "is_abstract": _astroid_utils.is_abstract_class(node),
         }
 
         overloads = {}
@@ -194,6 +424,35 @@ class Parser:
 
         data["children"] = list(self._resolve_inheritance(data))
 
+        if ancestors is None:
+            data["is_abstract"] = _astroid_utils.is_abstract_class(node)
+        else:
+            # The ancestors of the class are not inferred by astroid,
+            # so use what is known about them from their parsed data.
+            if not doc:
+                data["doc"] = next(
+                    (ancestor["doc"] for ancestor in ancestors if ancestor["doc"]),
+                    data["doc"],
+                )
+
+            metaclass = node.declared_metaclass()
+            data["metaclass"] = metaclass.name if metaclass else None
+            if not data["metaclass"]:
+                data["metaclass"] = next(
+                    (
+                        ancestor["metaclass"]
+                        for ancestor in ancestors
+                        if ancestor.get("metaclass")
+                    ),
+                    None,
+                )
+
+            data["is_abstract"] = (
+                data["metaclass"] == "ABCMeta"
+                or "abc.ABC" in node.basenames
+                or _has_abstract_methods(data, *ancestors)
+            )
+
         return data
 
     def _resolve_inheritance(self, *mro_data):
@@ -242,23 +501,165 @@ class Parser:
         return children.values()
 
     def _relevant_ancestors(self, node):
-        for base in node.ancestors():
-            if base.qname() in (
-                "__builtins__.object",
-                "builtins.object",
-                "builtins.type",
-            ):
+        for base in _astroid_utils.get_ancestors(node, self._boundary, self._budget):
+            if base.qname() in _IGNORED_ANCESTORS:
                 continue
 
             yield base
 
+    def _relabel_summary(self, summary, qual_prefix, full_prefix):
+        """Copy the parsed data of ancestors for use by another class.
+
+        The members of ancestors are named as if they were defined
+        on the class that inherits them,
+        so they are renamed to be members of the given class.
+        """
+        ancestors, old_qual_prefix, old_full_prefix = summary
+        ancestors = copy.deepcopy(ancestors)
+        if (old_qual_prefix, old_full_prefix) == (qual_prefix, full_prefix):
+            return ancestors
+
+        stack = [child for ancestor in ancestors for child in ancestor["children"]]
+        while stack:
+            child_data = stack.pop()
+            child_data["qual_name"] = _replace_name_prefix(
+                child_data["qual_name"], old_qual_prefix, qual_prefix
+            )
+            child_data["full_name"] = _replace_name_prefix(
+                child_data["full_name"], old_full_prefix, full_prefix
+            )
+            stack.extend(child_data.get("children", ()))
+
+        return ancestors
+
+    def _parse_ancestor(self, node, names, qual_prefix, full_prefix):
+        """Parse a base class and its ancestors.
+
+        Args:
+            node (astroid.nodes.ClassDef): The base class.
+            names (list(str)): The fully qualified names
+                that the base class is referenced by.
+            qual_prefix (str): The qualified name of the inheriting class.
+            full_prefix (str): The fully qualified name of the inheriting class.
+
+        Returns:
+            list(dict): The parsed data of the base class
+            followed by the parsed data of its relevant ancestors.
+        """
+        full_name = node.qname()
+        summary = self._parsed_ancestors.get(full_name)
+        if summary is None:
+            if full_name in self._parsing_ancestors:
+                return []
+
+            current_qual_prefix = ".".join(self._qual_name_stack)
+            current_full_prefix = ".".join(self._full_name_stack)
+            self._parsing_ancestors.add(full_name)
+            try:
+                ancestors = self._parse_ancestors(
+                    node, current_qual_prefix, current_full_prefix
+                )
+                data = self._parse_classdef(
+                    node, use_name_stacks=False, ancestors=ancestors
+                )
+            finally:
+                self._parsing_ancestors.discard(full_name)
+
+            summary = ([data] + ancestors, current_qual_prefix, current_full_prefix)
+            self._parsed_ancestors[full_name] = summary
+
+        if self._base_summaries.is_external(node):
+            self._base_summaries.add(summary, [full_name, *names])
+
+        return self._relabel_summary(summary, qual_prefix, full_prefix)
+
+    def _parse_ancestors(self, node, qual_prefix, full_prefix):
+        """Parse the relevant ancestors of a class.
+
+        Ancestors are returned in the same order as
+        :func:`~autoapi._astroid_utils.get_ancestors`.
+        Base classes that have been summarised are not inferred.
+
+        Args:
+            node (astroid.nodes.ClassDef): The class to parse the ancestors of.
+            qual_prefix (str): The qualified name of the inheriting class.
+            full_prefix (str): The fully qualified name of the inheriting class.
+
+        Returns:
+            list(dict): The parsed data of the relevant ancestors.
+        """
+        ancestors = []
+        seen = {node.qname()}
+        remaining = self._budget
+
+        for base in node.bases:
+            name = _astroid_utils.get_base_qualname(base)
+            if name is not None and name.split(".", 1)[0] in self._boundary:
+                continue
+
+            summary = self._base_summaries.get(name) if name is not None else None
+            if summary is not None:
+                parsed = self._relabel_summary(summary, qual_prefix, full_prefix)
+            else:
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+                    remaining -= 1
+
+                try:
+                    inferred = list(base.infer())
+                except astroid.InferenceError:
+                    continue
+
+                parsed = []
+                for base_node in inferred:
+                    if isinstance(base_node, astroid.bases.Instance):
+                        base_node = base_node._proxied
+                    if not isinstance(base_node, astroid.nodes.ClassDef):
+                        continue
+                    if base_node.root().name.split(".", 1)[0] in self._boundary:
+                        continue
+                    if base_node.qname() in _IGNORED_ANCESTORS:
+                        continue
+
+                    base_parsed = self._parse_ancestor(
+                        base_node, [name], qual_prefix, full_prefix
+                    )
+                    if base_node.hide:
+                        base_parsed = base_parsed[1:]
+                    parsed.extend(base_parsed)
+
+            for ancestor in parsed:
+                if ancestor["full_name"] in seen:
+                    continue
+
+                seen.add(ancestor["full_name"])
+                if ancestor["full_name"] not in _IGNORED_ANCESTORS:
+                    ancestors.append(ancestor)
+
+        return ancestors
+
     def parse_classdef(self, node):
-        data = self._parse_classdef(node, use_name_stacks=True)
+        if self._base_summaries is None:
+            data = self._parse_classdef(node, use_name_stacks=True)
+
+            ancestors = self._relevant_ancestors(node)
+            ancestor_data = [
+                self._parse_classdef(base, use_name_stacks=False) for base in ancestors
+            ]
+        else:
+            ancestor_data = self._parse_ancestors(
+                node,
+                self._get_qual_name(node.name),
+                self._get_full_name(node.name),
+            )
+            data = self._parse_classdef(
+                node, use_name_stacks=True, ancestors=ancestor_data
+            )
+            # The metaclass is needed only to summarise inheriting classes.
+            for cls_data in (data, *ancestor_data):
+                del cls_data["metaclass"]
 
-        ancestors = self._relevant_ancestors(node)
-        ancestor_data = [
-            self._parse_classdef(base, use_name_stacks=False) for base in ancestors
-        ]
         if ancestor_data:
             data["children"] = list(self._resolve_inheritance(data, *ancestor_data))
 
@@ -282,7 +683,9 @@ class Parser:
 
             if isinstance(node, astroid.nodes.AsyncFunctionDef):
                 properties.append("async")
-        elif _astroid_utils.is_decorated_with_property(node):
+        elif _astroid_utils.is_decorated_with_property(
+            node, self._boundary, self._budget
+        ):
             type_ = "property"
             if node.type == "classmethod":
                 properties.append(node.type)
@@ -442,11 +845,11 @@ class Parser:
     def parse(self, node):
         data = []
 
-        node_type = node.__class__.__name__.lower()
-        parse_func = getattr(self, "parse_" + node_type, None)
+        node_type = node.__class__
+        parse_func = self._PARSE_FUNCS.get(node_type)
         if parse_func:
-            data = parse_func(node)
-        else:
+            data = parse_func(self, node)
+        elif node_type not in _UNDOCUMENTED_NODES:
             for child in node.get_children():
                 data = self.parse(child)
                 if data:
@@ -454,6 +857,18 @@ class Parser:
 
         return data
 
+    _PARSE_FUNCS = types.MappingProxyType(
+        {
+            astroid.nodes.AnnAssign: parse_annassign,
+            astroid.nodes.Assign: parse_assign,
+            astroid.nodes.AsyncFunctionDef: parse_asyncfunctiondef,
+            astroid.nodes.ClassDef: parse_classdef,
+            astroid.nodes.FunctionDef: parse_functiondef,
+            astroid.nodes.Module: parse_module,
+            astroid.nodes.TypeAlias: parse_typealias,
+        }
+    )
+
 
 def _parse_child(child_data, overloads) -> bool:
     if child_data["type"] in ("function", "method", "property"):
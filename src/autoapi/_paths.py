@@ -0,0 +1,48 @@
+"""Functions for working with the paths of source files.
+
+These are kept apart from the parser so that they can be used
+without importing astroid.
+"""
+
+import collections
+import os
+
+
+def is_package_dir(directory):
+    """Check whether a directory is a regular package.
+
+    Args:
+        directory (str): The path to the directory to check.
+
+    Returns:
+        bool: True if the directory contains an ``__init__`` file, False otherwise.
+    """
+    return os.path.isfile(os.path.join(directory, "__init__.py")) or os.path.isfile(
+        os.path.join(directory, "__init__.pyi")
+    )
+
+
+def get_module_name(file_path, condition):
+    """Get the fully qualified name of the module that a file defines.
+
+    Args:
+        file_path (str): The path to the file.
+        condition (callable): Called with each parent directory of the file
+            in turn, until it returns False,
+            to check whether the directory is part of the module name.
+
+    Returns:
+        str: The name of the module.
+    """
+    directory, filename = os.path.split(file_path)
+    module_parts = []
+    if filename != "__init__.py" and filename != "__init__.pyi":
+        module_part = os.path.splitext(filename)[0]
+        module_parts = [module_part]
+    module_parts = collections.deque(module_parts)
+    while directory and condition(directory):
+        directory, module_part = os.path.split(directory)
+        if module_part:
+            module_parts.appendleft(module_part)
+
+    return ".".join(module_parts)
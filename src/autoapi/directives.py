@@ -1,13 +1,35 @@
 """AutoAPI directives"""
 
-from docutils.parsers.rst import Directive
+import hashlib
+import logging
+import pickle
+
+import docutils
+from docutils.parsers.rst import Directive, directives, roles
 from docutils import nodes
 
+import sphinx
+from sphinx import addnodes
 from sphinx.ext.autosummary import Autosummary, mangle_signature
+from sphinx.util.inspect import object_description
+from sphinx.util.logging import pending_logging
 from sphinx.util.nodes import nested_parse_with_titles
 
+from ._cache import describe_function, load_pickle, save_pickle
 from ._objects import PythonFunction
 
+# Nodes that the document that they are parsed in keeps track of.
+_DOCUMENT_NODES = (
+    nodes.system_message,
+    nodes.pending,
+    nodes.problematic,
+    nodes.substitution_reference,
+    nodes.footnote_reference,
+    nodes.citation_reference,
+    addnodes.desc,
+    addnodes.toctree,
+)
+
 
 class AutoapiSummary(Autosummary):
     """A version of autosummary that uses static analysis."""
@@ -40,6 +62,204 @@ class AutoapiSummary(Autosummary):
         return items
 
 
+def _describe_registry(registry):
+    # docutils' own roles and directives only change with docutils,
+    # and docutils also stores the ones that it has looked up in here.
+    return sorted(
+        (name, describe_function(value))
+        for name, value in registry.items()
+        if not getattr(value, "__module__", "").startswith("docutils.")
+    )
+
+
+def _get_nested_parse_settings(app):
+    """Get what parsing the content of a nested parse directive depends on.
+
+    This is every configuration value that causes Sphinx to read documents
+    again when it changes,
+    and the roles and directives that have been registered with docutils,
+    such as those added by a ``setup()`` function in ``conf.py``.
+
+    Args:
+        app (sphinx.application.Sphinx): The Sphinx application.
+
+    Returns:
+        str: A digest of the settings.
+    """
+    settings = (
+        sphinx.__version__,
+        docutils.__version__,
+        sorted(app.extensions),
+        sorted(
+            (option.name, object_description(option.value))
+            for option in app.config.filter("env")
+        ),
+        _describe_registry(roles._roles),
+        _describe_registry(directives._directives),
+    )
+    return hashlib.sha256(pickle.dumps(settings)).hexdigest()
+
+
+def _is_cacheable(children):
+    for child in children:
+        for node in child.findall(nodes.Element):
+            if isinstance(node, _DOCUMENT_NODES):
+                return False
+
+            # Ids, names and named references are registered with the document,
+            # and a source file is a dependency of the document.
+            attributes = node.attributes
+            if (
+                attributes.get("ids")
+                or attributes.get("names")
+                or "refname" in attributes
+                or attributes.get("anonymous")
+                or "source" in attributes
+            ):
+                return False
+
+    return True
+
+
+class NestedParseCache:
+    """A cache of the nodes that the content of nested parse directives parse to.
+
+    The cache remembers which documents used which nodes,
+    so that only the nodes used by documents that still exist are saved.
+
+    Args:
+        path (str): The file to store the parsed nodes in.
+        settings (str): A digest of what parsing depends on.
+            Nodes that were parsed with other settings are discarded.
+    """
+
+    def __init__(self, path, settings):
+        self._path = path
+        self._settings = settings
+        self._previous = {}
+        self._previous_used = {}
+        self._entries = {}
+        self._used = {}
+        self._purged = set()
+
+        stored = load_pickle(path, settings)
+        if stored is not None:
+            self._previous, self._previous_used = stored
+
+    def __getstate__(self):
+        """Obtains serialisable data for pickling."""
+        __dict__ = self.__dict__.copy()
+        # Only the new nodes need to be sent back from parallel readers.
+        __dict__["_previous"] = {}
+        __dict__["_previous_used"] = {}
+        return __dict__
+
+    @staticmethod
+    def get_key(content, ref_context, temp_data):
+        """Get the key to store the nodes of some directive content under.
+
+        Args:
+            content (list(str)): The content of the directive.
+            ref_context (dict): The reference context that the content is
+                parsed in, such as the current module.
+            temp_data (dict): The data of the document that the content is
+                parsed in, such as the language set by a ``highlight`` directive.
+
+        Returns:
+            bytes: The key.
+        """
+        context = (
+            sorted(ref_context.items()),
+            temp_data.get("highlight_language"),
+            temp_data.get("default_role"),
+        )
+        hasher = hashlib.sha256(repr(context).encode())
+        hasher.update("\n".join(content).encode("utf-8", "surrogatepass"))
+        return hasher.digest()
+
+    @property
+    def entries(self):
+        """dict(bytes, list(docutils.nodes.Node)): The nodes added in this build."""
+        return self._entries
+
+    @property
+    def used(self):
+        """dict(str, set(bytes)): The keys used in this build, by document."""
+        return self._used
+
+    def get(self, key, docname):
+        """Get a copy of the nodes stored under a key.
+
+        Args:
+            key (bytes): The key of the nodes.
+            docname (str): The document that the nodes are used in.
+
+        Returns:
+            list(docutils.nodes.Node) or None: The nodes,
+            or ``None`` if nothing is stored under the key.
+        """
+        children = self._entries.get(key)
+        if children is None:
+            children = self._previous.get(key)
+            if children is None:
+                return None
+
+        self._used.setdefault(docname, set()).add(key)
+        return [child.deepcopy() for child in children]
+
+    def add(self, key, children, docname):
+        """Store a copy of some nodes.
+
+        Args:
+            key (bytes): The key to store the nodes under.
+            children (list(docutils.nodes.Node)): The nodes.
+            docname (str): The document that the nodes are used in.
+        """
+        self._entries[key] = [child.deepcopy() for child in children]
+        self._used.setdefault(docname, set()).add(key)
+
+    def purge(self, docname):
+        """Forget the nodes that a document used in a previous build.
+
+        Args:
+            docname (str): The document that is being read again or was removed.
+        """
+        self._purged.add(docname)
+
+    def update(self, entries, used):
+        """Store nodes that were parsed elsewhere.
+
+        Args:
+            entries (dict(bytes, list(docutils.nodes.Node))): The nodes,
+                as given by :attr:`entries`.
+            used (dict(str, set(bytes))): The keys used by each document,
+                as given by :attr:`used`.
+        """
+        self._entries.update(entries)
+        for docname, keys in used.items():
+            self._used.setdefault(docname, set()).update(keys)
+
+    def save(self):
+        """Write the nodes used by current documents to disk."""
+        if not self._purged:
+            return
+
+        used = {
+            docname: keys
+            for docname, keys in self._previous_used.items()
+            if docname not in self._purged
+        }
+        used.update(self._used)
+        children = {**self._previous, **self._entries}
+        entries = {
+            key: children[key]
+            for keys in used.values()
+            for key in keys
+            if key in children
+        }
+        save_pickle(self._path, self._settings, (entries, used))
+
+
 class NestedParse(Directive):
     """Nested parsing to remove the first heading of included rST
 
@@ -53,7 +273,7 @@ class NestedParse(Directive):
     optional_arguments = 0
     final_argument_whitespace = False
 
-    def run(self):
+    def _parse(self):
         node = nodes.container()
         node.document = self.state.document
         nested_parse_with_titles(self.state, self.content, node)
@@ -64,4 +284,37 @@ class NestedParse(Directive):
                 node.children = node[0][1:] + node.children[1:]
         except IndexError:
             pass
+
+        return node
+
+    def run(self):
+        env = self.state.document.settings.env
+        cache = getattr(env, "autoapi_nested_parse_cache", None)
+        if cache is not None:
+            key = cache.get_key(self.content, env.ref_context, env.temp_data)
+            children = cache.get(key, env.docname)
+            if children is not None:
+                source = self.state.document.current_source
+                for child in children:
+                    for node in child.findall():
+                        if isinstance(node, addnodes.pending_xref):
+                            node["refdoc"] = env.docname
+                        if node.source is not None:
+                            node.source = source
+                return children
+
+        if cache is None:
+            return self._parse().children
+
+        # Content that warns is not stored, so that the warnings are shown
+        # every time that it is parsed.
+        with pending_logging() as memhandler:
+            node = self._parse()
+            warned = any(
+                record.levelno >= logging.WARNING for record in memhandler.buffer
+            )
+
+        if not warned and _is_cacheable(node.children):
+            cache.add(key, node.children, env.docname)
+
         return node.children
@@ -1,4 +1,5 @@
 import re
+import weakref
 
 import sphinx
 from sphinx.ext import autodoc
@@ -16,25 +17,44 @@ from ._objects import (
 
 
 LOGGER = sphinx.util.logging.getLogger(__name__)
+# The attribute getter of each type, by the registry that it was found in.
+# A documenter is created for every directive and member,
+# so the getters are shared between all of them.
+_ATTRGETTERS = weakref.WeakKeyDictionary()
 
 
 class AutoapiDocumenter(autodoc.Documenter):
-    def get_attr(self, obj, name, *defargs):
+    def _get_attrgetter(self, type_):
         if sphinx.version_info >= (9, 0):
-            attrgetters = self.env._registry.autodoc_attrgettrs
+            registry = self.env._registry
         else:
-            attrgetters = self.env.app.registry.autodoc_attrgettrs
+            registry = self.env.app.registry
+
+        attrgetter_cache = _ATTRGETTERS.get(registry)
+        if attrgetter_cache is None:
+            attrgetter_cache = _ATTRGETTERS[registry] = {}
+
+        if type_ not in attrgetter_cache:
+            attrgetters = registry.autodoc_attrgettrs
+            attrgetter_cache[type_] = None
+            for attrgetter_type, func in attrgetters.items():
+                if issubclass(type_, attrgetter_type):
+                    attrgetter_cache[type_] = func
+                    break
 
-        for type_, func in attrgetters.items():
-            if isinstance(obj, type_):
-                return func(obj, name, *defargs)
+        return attrgetter_cache[type_]
+
+    def get_attr(self, obj, name, *defargs):
+        attrgetter = self._get_attrgetter(type(obj))
+        if attrgetter is not None:
+            return attrgetter(obj, name, *defargs)
 
         if name == "__doc__":
             return obj.docstring
 
-        for child in obj.children:
-            if child.name == name:
-                return child
+        child = obj.get_child(name)
+        if child is not None:
+            return child
 
         if defargs:
             return defargs[0]
@@ -49,8 +69,22 @@ class AutoapiDocumenter(autodoc.Documenter):
         Returns:
             bool: True if the object was successfully imported and set, False otherwise.
         """
-        max_splits = self.fullname.count(".")
         objects = self.env.autoapi_all_objects
+
+        # Every documented object is indexed by its fully qualified name,
+        # so most names can be resolved with a single lookup.
+        current = objects.get(self.fullname)
+        if current:
+            parent = None
+            if "." in self.fullname:
+                parent = objects.get(self.fullname.rsplit(".", 1)[0])
+
+            self.object = current
+            self.object_name = current.name
+            self._method_parent = parent
+            return True
+
+        max_splits = self.fullname.count(".")
         for num_splits in range(max_splits, -1, -1):
             path_stack = list(reversed(self.fullname.rsplit(".", num_splits)))
             parent = None
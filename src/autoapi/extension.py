@@ -5,10 +5,12 @@ This extension allows you to automagically generate API documentation from your
 
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 
 import sphinx
+import sphinx.ext.inheritance_diagram
 from sphinx.util.console import colorize
 from sphinx.addnodes import toctree
 from sphinx.errors import ExtensionError
@@ -16,9 +18,14 @@ import sphinx.util.logging
 from docutils.parsers.rst import directives
 
 from . import documenters
-from .directives import AutoapiSummary, NestedParse
+from .directives import (
+    AutoapiSummary,
+    NestedParse,
+    NestedParseCache,
+    _get_nested_parse_settings,
+)
+from . import inheritance_diagrams
 from .inheritance_diagrams import AutoapiInheritanceDiagram
-from ._mapper import Mapper
 from .settings import API_ROOT
 
 LOGGER = sphinx.util.logging.getLogger(__name__)
@@ -41,8 +48,9 @@ _VALID_PAGE_LEVELS = [
     "method",
     "attribute",
 ]
-_VIEWCODE_CACHE: dict[str, tuple[str, dict[str, tuple[str, int, int]]]] = {}
-"""Caches a module's parse results for use in viewcode."""
+_VALID_INHERITANCE_DIAGRAM_SOURCES = ["astroid", "autoapi"]
+_VIEWCODE_SOURCE_CACHE_SIZE = 32
+"""The maximum number of source files to keep in memory for use in viewcode."""
 
 
 def _normalise_autoapi_dirs(autoapi_dirs, srcdir):
@@ -68,6 +76,12 @@ def run_autoapi(app):
     if own_page_level not in _VALID_PAGE_LEVELS:
         raise ValueError(f"Invalid autoapi_own_page_level '{own_page_level}")
 
+    diagram_source = app.config.autoapi_inheritance_diagram_source
+    if diagram_source not in _VALID_INHERITANCE_DIAGRAM_SOURCES:
+        raise ValueError(
+            f"Invalid autoapi_inheritance_diagram_source '{diagram_source}'"
+        )
+
     # Make sure the paths are full
     normalised_dirs = _normalise_autoapi_dirs(app.config.autoapi_dirs, app.srcdir)
     for _dir in normalised_dirs:
@@ -85,6 +99,10 @@ def run_autoapi(app):
         os.path.join(app.srcdir, app.config.autoapi_root)
     )
     url_root = os.path.join("/", app.config.autoapi_root)
+    # The mapper pulls in astroid and jinja2,
+    # so only import it when the builder starts rather than during setup.
+    from ._mapper import Mapper
+
     sphinx_mapper_obj = Mapper(
         app, template_dir=template_dir, dir_root=normalized_root, url_root=url_root
     )
@@ -120,6 +138,38 @@ def run_autoapi(app):
     app.config.autoapi_prepare_jinja_env = None
 
 
+def load_nested_parse_cache(app):
+    cache_dir = app.config.autoapi_nested_parse_cache_dir
+    app.env.autoapi_nested_parse_cache = None
+    if cache_dir:
+        app.env.autoapi_nested_parse_cache = NestedParseCache(
+            os.path.join(app.srcdir, cache_dir, "nested_parse.pickle"),
+            _get_nested_parse_settings(app),
+        )
+
+
+def env_merge_info(app, env, docnames, other):
+    cache = getattr(env, "autoapi_nested_parse_cache", None)
+    other_cache = getattr(other, "autoapi_nested_parse_cache", None)
+    if cache is not None and other_cache is not None:
+        cache.update(other_cache.entries, other_cache.used)
+
+
+def env_purge_doc(app, env, docname):
+    cache = getattr(env, "autoapi_nested_parse_cache", None)
+    if cache is not None:
+        cache.purge(docname)
+
+
+def save_nested_parse_cache(app, env):
+    cache = getattr(env, "autoapi_nested_parse_cache", None)
+    if cache is not None:
+        cache.save()
+        # Nested parses only happen while reading,
+        # so keep the nodes out of the pickled environment.
+        env.autoapi_nested_parse_cache = None
+
+
 def build_finished(app, exception):
     if not app.config.autoapi_keep_files and app.config.autoapi_generate_api_docs:
         normalized_root = os.path.normpath(
@@ -176,43 +226,35 @@ def doctree_read(app, doctree):
             LOGGER.info(message_prefix + message)
 
 
+@functools.lru_cache(maxsize=_VIEWCODE_SOURCE_CACHE_SIZE)
+def _read_source(file_path, encoding, stat_key):
+    # stat_key is only part of the cache key, so that a file that has changed
+    # is read again when the process outlives a build, such as sphinx-autobuild.
+    with open(file_path, encoding=encoding) as in_f:
+        return in_f.read()
+
+
 def viewcode_find(app, modname):
     objects = app.env.autoapi_objects
     if modname not in objects:
         return None
 
-    if modname in _VIEWCODE_CACHE:
-        return _VIEWCODE_CACHE[modname]
-
-    locations = {}
     module = objects[modname]
-    for child in module.children:
-        stack = [("", child)]
-        while stack:
-            prefix, obj = stack.pop()
-            type_ = "other"
-            if obj.type == "class":
-                type_ = "class"
-            elif obj.type in ("function", "method"):
-                type_ = "def"
-            full_name = prefix + obj.name
-            if "from_line_no" in obj.obj:
-                locations[full_name] = (
-                    type_,
-                    obj.obj["from_line_no"],
-                    obj.obj["to_line_no"],
-                )
-            children = getattr(obj, "children", ())
-            stack.extend((full_name + ".", gchild) for gchild in children)
-
-    stream = open(module.obj["file_path"], encoding=module.obj.get("encoding", "utf-8"))
-
-    with stream as in_f:
-        source = in_f.read()
-
-    result = (source, locations)
-    _VIEWCODE_CACHE[modname] = result
-    return result
+    all_locations = getattr(app.env, "autoapi_viewcode_locations", {})
+    locations = all_locations.get(modname)
+    if locations is None:
+        from ._mapper import _get_viewcode_locations
+
+        locations = _get_viewcode_locations(module)
+
+    file_path = module.obj["file_path"]
+    stat = os.stat(file_path)
+    source = _read_source(
+        file_path,
+        module.obj.get("encoding", "utf-8"),
+        (stat.st_mtime_ns, stat.st_size),
+    )
+    return (source, locations)
 
 
 def viewcode_follow_imported(app, modname, attribute):
@@ -236,6 +278,10 @@ def viewcode_follow_imported(app, modname, attribute):
 
 def setup(app):
     app.connect("builder-inited", run_autoapi)
+    app.connect("builder-inited", load_nested_parse_cache)
+    app.connect("env-purge-doc", env_purge_doc)
+    app.connect("env-merge-info", env_merge_info)
+    app.connect("env-updated", save_nested_parse_cache)
     app.connect("source-read", source_read)
     # Use a lower priority than the default to ensure that we can
     # inject into the toctree before Sphinx tries to use it
@@ -262,6 +308,17 @@ def setup(app):
     app.add_config_value("autoapi_generate_api_docs", True, "html")
     app.add_config_value("autoapi_prepare_jinja_env", None, "html")
     app.add_config_value("autoapi_own_page_level", "module", "html")
+    app.add_config_value("autoapi_skip_rules", {}, "html")
+    app.add_config_value("autoapi_inheritance_diagram_source", "astroid", "html")
+    app.add_config_value("autoapi_inheritance_diagram_cache_dir", None, "")
+    app.add_config_value("autoapi_inference_boundary", [], "html")
+    app.add_config_value("autoapi_inference_budget", None, "html")
+    app.add_config_value("autoapi_base_summary_cache_dir", None, "")
+    app.add_config_value("autoapi_release_astroid_cache", False, "")
+    app.add_config_value("autoapi_parallel_parse", False, "")
+    app.add_config_value("autoapi_docstring_cache_dir", None, "")
+    app.add_config_value("autoapi_pure_docstring_handlers", [], "")
+    app.add_config_value("autoapi_nested_parse_cache_dir", None, "")
     app.add_autodocumenter(documenters.AutoapiFunctionDocumenter)
     app.add_autodocumenter(documenters.AutoapiPropertyDocumenter)
     app.add_autodocumenter(documenters.AutoapiDecoratorDocumenter)
@@ -276,6 +333,14 @@ def setup(app):
     app.setup_extension("sphinx.ext.autosummary")
     app.add_event("autoapi-skip-member")
     app.setup_extension("sphinx.ext.inheritance_diagram")
+    app.add_node(
+        inheritance_diagrams.autoapi_inheritance_diagram,
+        latex=(inheritance_diagrams.latex_visit_inheritance_diagram, None),
+        html=(inheritance_diagrams.html_visit_inheritance_diagram, None),
+        text=(sphinx.ext.inheritance_diagram.skip, None),
+        man=(sphinx.ext.inheritance_diagram.skip, None),
+        texinfo=(inheritance_diagrams.texinfo_visit_inheritance_diagram, None),
+    )
     app.add_directive("autoapi-inheritance-diagram", AutoapiInheritanceDiagram)
 
     return {
@@ -1,8 +1,20 @@
-import astroid
+import hashlib
+import os
+import pathlib
+import shutil
+import subprocess
+
+import sphinx.ext.graphviz
 import sphinx.ext.inheritance_diagram
 
+from ._cache import replace_atomically
+from ._objects import PythonClass, TopLevelPythonObject
+
 
 def _do_import_class(name, currmodule=None):
+    # astroid is only needed once a diagram is built, not during setup.
+    import astroid
+
     path_stack = list(reversed(name.split(".")))
     if not currmodule:
         currmodule = path_stack.pop()
@@ -26,6 +38,8 @@ def _do_import_class(name, currmodule=None):
 
 
 def _import_class(name, currmodule):
+    import astroid
+
     target = None
     if currmodule:
         target = _do_import_class(name, currmodule)
@@ -63,6 +77,17 @@ class _AutoapiInheritanceGraph(sphinx.ext.inheritance_diagram.InheritanceGraph):
 
         return classes
 
+    @staticmethod
+    def _is_builtin(node):
+        return node.root().name == "builtins"
+
+    @staticmethod
+    def _class_doc(node):
+        return node.doc_node.value if node.doc_node else ""
+
+    def _class_bases(self, node):
+        return node.ancestors(recurs=False)
+
     def _class_info(
         self, classes, show_builtins, private_bases, parts, aliases, top_classes
     ):
@@ -71,7 +96,7 @@ class _AutoapiInheritanceGraph(sphinx.ext.inheritance_diagram.InheritanceGraph):
         def recurse(cls):
             if cls in all_classes:
                 return
-            if not show_builtins and cls.root().name == "builtins":
+            if not show_builtins and self._is_builtin(cls):
                 return
             if not private_bases and cls.name.startswith("_"):
                 return
@@ -80,10 +105,9 @@ class _AutoapiInheritanceGraph(sphinx.ext.inheritance_diagram.InheritanceGraph):
             fullname = self.class_name(cls, 0, aliases)
 
             tooltip = None
-            if cls.doc_node:
-                doc = cls.doc_node.value.strip().split("\n")[0]
-                if doc:
-                    tooltip = '"%s"' % doc.replace('"', '\\"')
+            doc = self._class_doc(cls).strip().split("\n")[0]
+            if doc:
+                tooltip = '"%s"' % doc.replace('"', '\\"')
 
             baselist = []
             all_classes[cls] = (nodename, fullname, baselist, tooltip or "")
@@ -91,8 +115,8 @@ class _AutoapiInheritanceGraph(sphinx.ext.inheritance_diagram.InheritanceGraph):
             if fullname in top_classes:
                 return
 
-            for base in cls.ancestors(recurs=False):
-                if not show_builtins and base.root().name == "builtins":
+            for base in self._class_bases(cls):
+                if not show_builtins and self._is_builtin(base):
                     continue
                 if not private_bases and base.name.startswith("_"):
                     continue
@@ -120,12 +144,243 @@ class _AutoapiInheritanceGraph(sphinx.ext.inheritance_diagram.InheritanceGraph):
         return result
 
 
+class _AutoapiObjectInheritanceGraph(_AutoapiInheritanceGraph):
+    """An inheritance graph built from the classes that AutoAPI has parsed.
+
+    astroid is used only for classes that are not part of the documented API.
+
+    Args:
+        all_objects (dict(str, PythonObject)): All objects known to AutoAPI.
+    """
+
+    def __init__(self, all_objects, *args, **kwargs):
+        self._all_objects = all_objects
+        try:
+            super().__init__(*args, **kwargs)
+        finally:
+            # The graph is pickled with every doctree that contains it,
+            # so keep only the class information that it was built into.
+            del self._all_objects
+
+    def _import_classes(self, class_names, currmodule):
+        classes = []
+
+        for name in class_names:
+            target = None
+            if currmodule:
+                target = self._all_objects.get(f"{currmodule}.{name}")
+            if target is None:
+                target = self._all_objects.get(name)
+
+            if target is None:
+                classes.extend(_import_class(name, currmodule))
+            elif isinstance(target, PythonClass):
+                classes.append(target)
+            elif isinstance(target, TopLevelPythonObject):
+                classes.extend(
+                    child for child in target.children if isinstance(child, PythonClass)
+                )
+            else:
+                raise sphinx.ext.inheritance_diagram.InheritanceException(
+                    f"{name} specified for inheritance diagram is not a class or module"
+                )
+
+        return classes
+
+    @staticmethod
+    def _is_builtin(node):
+        if isinstance(node, PythonClass):
+            return False
+
+        return _AutoapiInheritanceGraph._is_builtin(node)
+
+    @staticmethod
+    def _class_doc(node):
+        if isinstance(node, PythonClass):
+            return node.docstring
+
+        return _AutoapiInheritanceGraph._class_doc(node)
+
+    def _class_bases(self, node):
+        if not isinstance(node, PythonClass):
+            yield from super()._class_bases(node)
+            return
+
+        for basename in node.bases:
+            base = self._resolve_base(node, basename)
+            if base is not None:
+                yield base
+
+    def _resolve_base(self, cls, basename):
+        import astroid.nodes
+
+        # Generic bases are documented with their parameters.
+        basename = basename.split("[", 1)[0]
+
+        # Base names are documented relative to the class' module
+        # when they are defined in the same module.
+        module_name = cls.id[: -len(cls.qual_name) - 1]
+        for candidate in (f"{module_name}.{basename}", basename):
+            base = self._all_objects.get(candidate)
+            if isinstance(base, PythonClass):
+                return base
+
+        # Builtins and typing prefixes are stripped from base names.
+        candidates = [basename]
+        if "." not in basename:
+            candidates = [f"builtins.{basename}", f"typing.{basename}"]
+
+        for candidate in candidates:
+            base = _do_import_class(candidate)
+            if isinstance(base, astroid.nodes.ClassDef):
+                return base
+
+        return None
+
+    @staticmethod
+    def class_name(node, parts=0, aliases=None):
+        if not isinstance(node, PythonClass):
+            return _AutoapiInheritanceGraph.class_name(node, parts, aliases)
+
+        fullname = node.id
+        if parts == 0:
+            result = fullname
+        else:
+            name_parts = fullname.split(".")
+            result = ".".join(name_parts[-parts:])
+        if aliases is not None and result in aliases:
+            return aliases[result]
+        return result
+
+
+def _graph_cache_key(class_names, currmodule, **kwargs):
+    options = []
+    for name, value in sorted(kwargs.items()):
+        if isinstance(value, dict):
+            value = tuple(sorted(value.items()))
+        options.append((name, value))
+
+    return (tuple(class_names), currmodule, tuple(options))
+
+
+class autoapi_inheritance_diagram(sphinx.ext.inheritance_diagram.inheritance_diagram):
+    """An inheritance diagram whose rendered output is cached across builds."""
+
+
+class _CachedDotRunner:
+    """A stand-in for :mod:`subprocess` that reuses previously rendered output.
+
+    The output of ``dot`` is stored under a key made from
+    the command line (excluding output paths),
+    which includes the output format and the graphviz options,
+    and the DOT source given as input.
+
+    Args:
+        cache_dir (pathlib.Path): The directory to store rendered output in.
+    """
+
+    def __init__(self, cache_dir):
+        self._cache_dir = cache_dir
+
+    def __getattr__(self, name):
+        return getattr(subprocess, name)
+
+    def run(self, args, *, input=None, check=False, **kwargs):
+        str_args = [str(arg) for arg in args]
+        outputs = [arg[2:] for arg in str_args if arg.startswith("-o")]
+        key_args = [arg for arg in str_args if not arg.startswith("-o")]
+        hasher = hashlib.sha256("\0".join(key_args).encode())
+        hasher.update(b"\0" + (input or b""))
+        key = hasher.hexdigest()
+        cached = [self._cache_dir / f"{key}-{i}" for i in range(len(outputs))]
+
+        if outputs and all(path.is_file() for path in cached):
+            for cached_path, output in zip(cached, outputs):
+                shutil.copyfile(cached_path, output)
+            return subprocess.CompletedProcess(args, 0, b"", b"")
+
+        result = subprocess.run(args, check=False, input=input, **kwargs)
+        if result.returncode != 0:
+            # Output that dot failed to render is not cached.
+            if check:
+                result.check_returncode()
+            return result
+
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        for cached_path, output in zip(cached, outputs):
+            if not os.path.isfile(output):
+                continue
+            with (
+                open(output, "rb") as output_file,
+                replace_atomically(cached_path) as cached_file,
+            ):
+                shutil.copyfileobj(output_file, cached_file)
+
+        return result
+
+
+def _dot_cache_dir(builder):
+    cache_dir = builder.config.autoapi_inheritance_diagram_cache_dir
+    if not cache_dir:
+        return pathlib.Path(builder.doctreedir) / "autoapi_graphviz"
+
+    return pathlib.Path(builder.srcdir) / cache_dir
+
+
+def _cache_dot_output(visit):
+    def _visit(self, node):
+        # Yucky! Monkeypatch subprocess for the graphviz extension
+        # to reuse output instead of running dot.
+        old_subprocess = sphinx.ext.graphviz.subprocess
+        sphinx.ext.graphviz.subprocess = _CachedDotRunner(_dot_cache_dir(self.builder))
+        try:
+            visit(self, node)
+        finally:
+            sphinx.ext.graphviz.subprocess = old_subprocess
+
+    return _visit
+
+
+html_visit_inheritance_diagram = _cache_dot_output(
+    sphinx.ext.inheritance_diagram.html_visit_inheritance_diagram
+)
+latex_visit_inheritance_diagram = _cache_dot_output(
+    sphinx.ext.inheritance_diagram.latex_visit_inheritance_diagram
+)
+texinfo_visit_inheritance_diagram = _cache_dot_output(
+    sphinx.ext.inheritance_diagram.texinfo_visit_inheritance_diagram
+)
+
+
 class AutoapiInheritanceDiagram(sphinx.ext.inheritance_diagram.InheritanceDiagram):
+    def _create_graph(self, class_names, currmodule, **kwargs):
+        source = self.config.autoapi_inheritance_diagram_source
+        graphs = getattr(self.env, "autoapi_inheritance_graphs", None)
+        if graphs is None:
+            graphs = self.env.autoapi_inheritance_graphs = {}
+
+        key = (source, _graph_cache_key(class_names, currmodule, **kwargs))
+        if key not in graphs:
+            if source == "autoapi":
+                graphs[key] = _AutoapiObjectInheritanceGraph(
+                    self.env.autoapi_all_objects, class_names, currmodule, **kwargs
+                )
+            else:
+                graphs[key] = _AutoapiInheritanceGraph(
+                    class_names, currmodule, **kwargs
+                )
+
+        return graphs[key]
+
     def run(self):
-        # Yucky! Monkeypatch InheritanceGraph to use our own
+        # Yucky! Monkeypatch InheritanceGraph and inheritance_diagram
+        # to use our own
         old_graph = sphinx.ext.inheritance_diagram.InheritanceGraph
-        sphinx.ext.inheritance_diagram.InheritanceGraph = _AutoapiInheritanceGraph
+        old_node = sphinx.ext.inheritance_diagram.inheritance_diagram
+        sphinx.ext.inheritance_diagram.InheritanceGraph = self._create_graph
+        sphinx.ext.inheritance_diagram.inheritance_diagram = autoapi_inheritance_diagram
         try:
             return super().run()
         finally:
             sphinx.ext.inheritance_diagram.InheritanceGraph = old_graph
+            sphinx.ext.inheritance_diagram.inheritance_diagram = old_node
@@ -1,11 +1,18 @@
 """Test Python parser"""
 
+import importlib.metadata
+import os
 import sys
 
 import astroid
 import pytest
 
-from autoapi._parser import Parser
+from autoapi._parser import (
+    BaseSummaryCache,
+    Parser,
+    get_module_name,
+    is_package_dir,
+)
 
 
 class TestPythonParser:
@@ -145,3 +152,135 @@ class TestPythonParser:
         param = data["type_params"][0]
         assert param.name == "T"
         assert param.annotation is None
+
+    def test_parses_if_block(self):
+        source = """
+        if True:
+            print("Not documented")
+            def foo(bar):
+                pass
+        """
+        module = astroid.parse(source)
+        data = Parser().parse(module.body[0])
+        assert [child["name"] for child in data] == ["foo"]
+
+
+def test_parse_funcs_cover_parse_methods():
+    parse_methods = {
+        name
+        for name in dir(Parser)
+        if name.startswith("parse_") and not name.startswith("parse_file")
+    }
+    assert {func.__name__ for func in Parser._PARSE_FUNCS.values()} == parse_methods
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("package/__init__.py", "package"),
+        ("package/module.py", "package.module"),
+        ("package/sub/__init__.pyi", "package.sub"),
+        ("package/sub/module.pyi", "package.sub.module"),
+        ("module.py", "module"),
+    ],
+)
+def test_get_module_name(tmp_path, path, expected):
+    for package in ("package", "package/sub"):
+        (tmp_path / package).mkdir(exist_ok=True)
+    (tmp_path / "package" / "__init__.py").touch()
+    (tmp_path / "package" / "sub" / "__init__.pyi").touch()
+
+    file_path = os.path.join(str(tmp_path), *path.split("/"))
+    assert get_module_name(file_path, is_package_dir) == expected
+
+
+def _without_inherited_from(data):
+    # The parent of inherited members refers back to the member.
+    if isinstance(data, list):
+        return [_without_inherited_from(item) for item in data]
+    if isinstance(data, dict):
+        return {
+            key: _without_inherited_from(value)
+            for key, value in data.items()
+            if key != "inherited_from"
+        }
+    return data
+
+
+def test_base_summary_cache(tmp_path, monkeypatch):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    module_path = source_dir / "module.py"
+    module_path.write_text(
+        "from jinja2 import BaseLoader\n"
+        "from jinja2.exceptions import TemplateError\n"
+        "\n"
+        "class MyLoader(BaseLoader):\n"
+        "    def list_templates(self):\n"
+        "        pass\n"
+        "\n"
+        "class MyError(TemplateError):\n"
+        "    pass\n"
+    )
+    cache_dir = tmp_path / "cache"
+
+    def parse():
+        summaries = BaseSummaryCache(str(cache_dir), [str(source_dir)])
+        data = Parser(base_summaries=summaries).parse_file(str(module_path))
+        summaries.save()
+        return _without_inherited_from(data)
+
+    uncached = _without_inherited_from(Parser().parse_file(str(module_path)))
+    first = parse()
+    assert first == uncached
+
+    version = importlib.metadata.version("jinja2")
+    assert os.listdir(cache_dir) == [f"Jinja2-{version}.pickle"]
+
+    parsed = []
+    parse_classdef = Parser._parse_classdef
+
+    def record_parse_classdef(self, node, *args, **kwargs):
+        parsed.append(node.qname())
+        return parse_classdef(self, node, *args, **kwargs)
+
+    monkeypatch.setattr(Parser, "_parse_classdef", record_parse_classdef)
+
+    second = parse()
+    assert second == first
+    assert parsed == ["module.MyLoader", "module.MyError"]
+
+    loader, error = second["children"]
+    assert error["type"] == "exception"
+    get_source = next(
+        child for child in loader["children"] if child["name"] == "get_source"
+    )
+    assert get_source["full_name"] == "module.MyLoader.get_source"
+
+
+def test_base_summary_cache_merges_other_caches(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    cache_dir = tmp_path / "cache"
+    modules = {
+        "loader.py": "from jinja2 import BaseLoader\nclass MyLoader(BaseLoader): pass\n",
+        "error.py": "from jinja2.exceptions import TemplateError\n"
+        "class MyError(TemplateError): pass\n",
+    }
+
+    workers = []
+    for name, source in modules.items():
+        module_path = source_dir / name
+        module_path.write_text(source)
+        summaries = BaseSummaryCache(str(cache_dir), [str(source_dir)])
+        Parser(base_summaries=summaries).parse_file(str(module_path))
+        workers.append(summaries)
+
+    main = BaseSummaryCache(str(cache_dir), [str(source_dir)])
+    for summaries in workers:
+        main.update(summaries.modified)
+    main.save()
+
+    reloaded = BaseSummaryCache(str(cache_dir), [str(source_dir)])
+    assert reloaded.get("jinja2.BaseLoader") is not None
+    assert reloaded.get("jinja2.exceptions.TemplateError") is not None
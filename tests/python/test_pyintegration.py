@@ -1,10 +1,28 @@
 import logging
 import os
 import pathlib
+import pickle
+import re
+import shutil
+import subprocess
 import sys
-from unittest.mock import Mock, call
+from unittest.mock import MagicMock, Mock, call
 
+import autoapi.directives
+import autoapi.documenters
+import autoapi.extension
+import autoapi.inheritance_diagrams
 import autoapi.settings
+from autoapi._cache import describe_function
+from autoapi._mapper import (
+    Mapper,
+    _PARSE_CONFIG,
+    _RENDER_CONFIG,
+    _DirectoryListings,
+    _resolve_component_placeholders,
+    _strongly_connected_components,
+    _visit_data,
+)
 from autoapi._objects import (
     PythonClass,
     PythonData,
@@ -12,10 +30,14 @@ from autoapi._objects import (
     PythonMethod,
     PythonModule,
 )
+from autoapi.directives import NestedParseCache
+import docutils.nodes
+import docutils.parsers.rst.roles
 from packaging import version
 import pytest
 import sphinx
 from sphinx.application import Sphinx
+from sphinx.config import ConfigValue
 from sphinx.errors import ExtensionError
 import sphinx.util.logging
 
@@ -178,6 +200,15 @@ class TestSimpleModuleManual:
         example_file = parse("_build/html/manualapi.html")
         assert example_file.find(id="example.decorator_okay")
 
+    def test_method_directive(self, parse):
+        example_file = parse("_build/html/manualapi.html")
+
+        method_names = example_file.find_all(class_="sig-name", string="method_okay")
+        method_sig = method_names[-1].parent
+        assert method_sig.find(class_="sig-prename").text == "Foo."
+        args = method_sig.find_all(class_="sig-param")
+        assert [arg.text for arg in args] == ["foo=None", "bar=None"]
+
     def test_dataclass(self, parse):
         example_file = parse("_build/html/manualapi.html")
 
@@ -938,6 +969,69 @@ def test_skipping_members(builder, parse):
     assert example_file.find(id="example.anchor")
 
 
+def test_viewcode(builder, parse):
+    confoverrides = {
+        "extensions": [
+            "sphinx.ext.autodoc",
+            "sphinx.ext.viewcode",
+            "autoapi.extension",
+        ],
+        "exclude_patterns": ["manualapi.rst"],
+    }
+    builder("pyexample", warningiserror=True, confoverrides=confoverrides)
+
+    example_file = parse("_build/html/autoapi/example/index.html")
+    foo_sig = example_file.find(id="example.Foo")
+    assert foo_sig.find(class_="viewcode-link")
+
+    source_file = parse("_build/html/_modules/example.html")
+    assert source_file.find(id="Foo")
+    assert source_file.find(id="Foo.method_okay")
+
+
+def test_viewcode_reads_changed_source(tmp_path):
+    source_path = tmp_path / "example.py"
+    source_path.write_text("a = 1\n")
+    app = Mock()
+    app.env.autoapi_objects = {"example": Mock(obj={"file_path": str(source_path)})}
+    app.env.autoapi_viewcode_locations = {"example": {}}
+    assert autoapi.extension.viewcode_find(app, "example")[0] == "a = 1\n"
+
+    source_path.write_text("a = 22\n")
+    assert autoapi.extension.viewcode_find(app, "example")[0] == "a = 22\n"
+
+
+def test_skip_rules(builder, parse):
+    confoverrides = {
+        "autoapi_options": ["members", "undoc-members"],
+        "autoapi_skip_rules": {
+            "class": {"exclude": ["example.Bar", "example.Typed*"]},
+            "method": {"exclude": ["*_okay"], "include": ["example.Foo.__*__"]},
+        },
+        "exclude_patterns": ["manualapi.rst"],
+    }
+    builder("pyexample", warningiserror=True, confoverrides=confoverrides)
+
+    example_file = parse("_build/html/autoapi/example/index.html")
+
+    assert example_file.find(id="example.Foo")
+    assert not example_file.find(id="example.Bar")
+    assert not example_file.find(id="example.TypedAttrs")
+    assert not example_file.find(id="example.TypedClassInit")
+    assert example_file.find(id="example.Two")
+    assert not example_file.find(id="example.Foo.method_okay")
+    assert example_file.find(id="example.Foo.method_multiline")
+    assert example_file.find(id="example.Foo.__init__")
+    # Functions are not affected by the method rules
+    assert example_file.find(id="example.decorator_okay")
+
+
+def test_skip_rules_unknown_type(builder):
+    confoverrides = {"autoapi_skip_rules": {"klass": {"exclude": ["*"]}}}
+    with pytest.raises(ExtensionError, match="klass"):
+        builder("pyexample", confoverrides=confoverrides)
+
+
 @pytest.mark.parametrize(
     "value,order",
     [
@@ -1063,6 +1157,323 @@ def test_skip_members_hook(builder):
         assert mock_call in emit_firstresult_patch.mock_calls
 
 
+@pytest.mark.parametrize("source", ["astroid", "autoapi"])
+def test_inheritance_diagram_source(builder, source):
+    os.chdir("tests/python/pyexample")
+    app = Sphinx(
+        srcdir=".",
+        confdir=".",
+        outdir="_build/text",
+        doctreedir="_build/.doctrees",
+        buildername="text",
+        warningiserror=True,
+        confoverrides={
+            "autoapi_options": ["members", "show-inheritance-diagram"],
+            "autoapi_inheritance_diagram_source": source,
+            "exclude_patterns": ["manualapi.rst"],
+            "suppress_warnings": [
+                "app.add_node",
+                "app.add_directive",
+                "app.add_role",
+            ],
+        },
+    )
+    app.build()
+
+    graphs = {
+        tuple(graph.class_names): graph
+        for graph in app.env.autoapi_inheritance_graphs.values()
+    }
+    bar_graph = graphs[("example.Bar",)]
+    assert {info[1]: info[2] for info in bar_graph.class_info} == {
+        "example.Bar": ["Foo"],
+        "example.Foo": [],
+    }
+    two_graph = graphs[("example.Two",)]
+    assert {info[1]: info[2] for info in two_graph.class_info} == {
+        "example.Two": ["One"],
+        "example.One": [],
+    }
+
+    # Graphs are pickled with the doctrees that they are in.
+    loaded = set()
+
+    class _Unpickler(pickle.Unpickler):
+        def find_class(self, module, name):
+            loaded.add((module, name))
+            return super().find_class(module, name)
+
+    with open("_build/.doctrees/autoapi/example/index.doctree", "rb") as doctree:
+        _Unpickler(doctree).load()
+    assert ("autoapi.inheritance_diagrams", "autoapi_inheritance_diagram") in loaded
+    assert not any(module == "autoapi._objects" for module, _ in loaded)
+
+
+def test_inheritance_diagram_cache(builder, rebuild, tmp_path):
+    calls_file = tmp_path / "calls.txt"
+    fake_dot = tmp_path / "dot"
+    fake_dot.write_text(
+        f"""#!{sys.executable}
+import sys
+
+with open({str(calls_file)!r}, "a") as calls:
+    calls.write("call\\n")
+
+for arg in sys.argv[1:]:
+    if arg.startswith("-o"):
+        with open(arg[2:], "w") as out_f:
+            out_f.write('<svg xmlns="http://www.w3.org/2000/svg"></svg>')
+"""
+    )
+    fake_dot.chmod(0o755)
+
+    confoverrides = {
+        "autoapi_options": ["members", "show-inheritance-diagram"],
+        "autoapi_inheritance_diagram_cache_dir": str(tmp_path / "cache"),
+        "graphviz_dot": str(fake_dot),
+        "graphviz_output_format": "svg",
+        "exclude_patterns": ["manualapi.rst"],
+    }
+    builder("pyexample", warningiserror=True, confoverrides=confoverrides)
+    num_calls = len(calls_file.read_text().splitlines())
+    assert num_calls
+
+    shutil.rmtree("_build")
+    rebuild(warningiserror=True, confoverrides=confoverrides)
+    assert len(calls_file.read_text().splitlines()) == num_calls
+    assert list(pathlib.Path("_build/html/_images").glob("inheritance-*.svg"))
+
+
+def test_failed_dot_output_is_not_cached(tmp_path):
+    runner = autoapi.inheritance_diagrams._CachedDotRunner(tmp_path / "cache")
+    output = tmp_path / "out.svg"
+    script = "import sys; open(sys.argv[1][2:], 'w').write('partial'); sys.exit(1)"
+    args = [sys.executable, "-c", script, f"-o{output}"]
+
+    with pytest.raises(subprocess.CalledProcessError):
+        runner.run(args, input=b"", capture_output=True, check=True)
+
+    assert runner.run(args, input=b"", capture_output=True).returncode == 1
+    assert not (tmp_path / "cache").exists()
+
+
+def test_docstring_cache(builder, rebuild, tmp_path):
+    calls_file = tmp_path / "calls.txt"
+    confdir = tmp_path / "conf"
+    confdir.mkdir()
+    conf = pathlib.Path("tests/python/pyexample/conf.py").resolve()
+    (confdir / "conf.py").write_text(
+        f"""exec(open({str(conf)!r}).read())
+
+
+def _process_docstring(app, what, name, obj, options, lines):
+    with open({str(calls_file)!r}, "a") as calls:
+        calls.write(name + "\\n")
+    lines.append("Processed by a handler.")
+
+
+def setup(app):
+    app.connect("autodoc-process-docstring", _process_docstring)
+"""
+    )
+
+    confoverrides = {
+        "autoapi_docstring_cache_dir": str(tmp_path / "cache"),
+        "exclude_patterns": ["manualapi.rst"],
+    }
+    builder(
+        "pyexample",
+        confdir=str(confdir),
+        warningiserror=True,
+        confoverrides=confoverrides,
+    )
+    num_calls = len(calls_file.read_text().splitlines())
+    assert num_calls
+
+    shutil.rmtree("_build")
+    rebuild(confdir=str(confdir), warningiserror=True, confoverrides=confoverrides)
+    assert len(calls_file.read_text().splitlines()) == num_calls
+    example_file = pathlib.Path("_build/html/autoapi/example/index.html")
+    assert "Processed by a handler." in example_file.read_text()
+
+
+def test_describe_function_follows_constants_and_captured_values():
+    def make_handler(suffix, extra=()):
+        def handler(app, what, name, obj, options, lines, sep="\n"):
+            def inner():
+                return "Processed"
+
+            lines.append(inner() + suffix + sep.join(extra))
+
+        return handler
+
+    describe = describe_function
+    assert describe(make_handler(".")) == describe(make_handler("."))
+    assert describe(make_handler(".")) != describe(make_handler("!"))
+    assert describe(make_handler(".", ["a"])) != describe(make_handler(".", ["b"]))
+
+    def inner_constant(app, what, name, obj, options, lines):
+        def inner():
+            return "Processed"
+
+        lines.append(inner())
+
+    def other_inner_constant(app, what, name, obj, options, lines):
+        def inner():
+            return "Changed"
+
+        lines.append(inner())
+
+    assert describe(inner_constant)[2] != describe(other_inner_constant)[2]
+
+    def with_default(lines, suffix="."):
+        lines.append(suffix)
+
+    before = describe(with_default)
+    with_default.__defaults__ = ("!",)
+    assert describe(with_default) != before
+
+    # Values that cannot be described never match a previous description.
+    unpicklable = make_handler(".", [lambda: None])
+    assert describe(unpicklable) != describe(unpicklable)
+
+
+def test_nested_parse_cache(builder, rebuild, tmp_path, monkeypatch):
+    calls = []
+    nested_parse_with_titles = autoapi.directives.nested_parse_with_titles
+
+    def _nested_parse_with_titles(state, content, node, *args, **kwargs):
+        calls.append("\n".join(content))
+        return nested_parse_with_titles(state, content, node, *args, **kwargs)
+
+    monkeypatch.setattr(
+        autoapi.directives, "nested_parse_with_titles", _nested_parse_with_titles
+    )
+
+    confoverrides = {
+        "autoapi_nested_parse_cache_dir": str(tmp_path / "cache"),
+        "exclude_patterns": ["manualapi.rst"],
+    }
+    builder("pyexample", warningiserror=True, confoverrides=confoverrides)
+    assert (tmp_path / "cache" / "nested_parse.pickle").is_file()
+    with open("_build/.doctrees/environment.pickle", "rb") as env_file:
+        assert pickle.load(env_file).autoapi_nested_parse_cache is None
+    num_calls = len(calls)
+    assert num_calls
+    example_path = pathlib.Path("_build/html/autoapi/example/index.html")
+    example_html = example_path.read_text()
+
+    shutil.rmtree("_build")
+    rebuild(warningiserror=True, confoverrides=confoverrides)
+    assert len(calls) == num_calls
+    assert example_path.read_text() == example_html
+
+
+def test_attrgetters_are_shared_between_documenters():
+    registry = Mock()
+    registry.autodoc_attrgettrs.items.return_value = []
+    env = Mock(_registry=registry, app=Mock(registry=registry))
+
+    for _ in range(2):
+        documenter = autoapi.documenters.AutoapiDocumenter.__new__(
+            autoapi.documenters.AutoapiDocumenter
+        )
+        documenter.env = env
+        assert documenter._get_attrgetter(PythonClass) is None
+
+    registry.autodoc_attrgettrs.items.assert_called_once()
+
+
+def test_nested_parse_settings_follow_config_and_roles(monkeypatch):
+    app = Mock(extensions={})
+    app.config.filter.return_value = [
+        ConfigValue("extlinks", {"issue": ("https://one.example/%s", None)}, "env")
+    ]
+    settings = autoapi.directives._get_nested_parse_settings(app)
+    assert autoapi.directives._get_nested_parse_settings(app) == settings
+
+    app.config.filter.return_value = [
+        ConfigValue("extlinks", {"issue": ("https://two.example/%s", None)}, "env")
+    ]
+    changed_config = autoapi.directives._get_nested_parse_settings(app)
+    assert changed_config != settings
+
+    monkeypatch.setitem(
+        docutils.parsers.rst.roles._roles, "custom", lambda *args: ([], [])
+    )
+    assert autoapi.directives._get_nested_parse_settings(app) != changed_config
+
+
+def test_nested_parse_cache_keeps_used_nodes(tmp_path):
+    path = str(tmp_path / "nested_parse.pickle")
+    key_a = NestedParseCache.get_key(["a"], {}, {})
+    key_b = NestedParseCache.get_key(["b"], {}, {})
+
+    cache = NestedParseCache(path, "settings")
+    for docname, key in (("a", key_a), ("b", key_b)):
+        cache.purge(docname)
+        cache.add(key, [docutils.nodes.paragraph(text=docname)], docname)
+    cache.save()
+
+    # Document "a" is read again and no longer uses its nodes.
+    cache = NestedParseCache(path, "settings")
+    cache.purge("a")
+    cache.save()
+
+    cache = NestedParseCache(path, "settings")
+    assert cache.get(key_a, "a") is None
+    assert cache.get(key_b, "b")[0].astext() == "b"
+
+
+def test_nested_parse_cache_key_includes_document_state():
+    key = NestedParseCache.get_key(["``x``"], {}, {})
+    assert key != NestedParseCache.get_key(["``x``"], {}, {"default_role": "code"})
+    assert key != NestedParseCache.get_key(["``x``"], {}, {"highlight_language": "c"})
+
+
+def test_pure_docstring_handlers_run_in_parse_workers(builder, tmp_path):
+    calls_file = tmp_path / "calls.txt"
+    confdir = tmp_path / "conf"
+    confdir.mkdir()
+    conf = pathlib.Path("tests/python/pyexample/conf.py").resolve()
+    (confdir / "conf.py").write_text(
+        f"""import os
+
+exec(open({str(conf)!r}).read())
+
+
+def _process_docstring(app, what, name, obj, options, lines):
+    with open({str(calls_file)!r}, "a") as calls:
+        calls.write(str(os.getpid()) + "\\n")
+    lines.append("Processed by a handler.")
+
+
+def setup(app):
+    app.connect("autodoc-process-docstring", _process_docstring)
+"""
+    )
+
+    builder(
+        "pyexample",
+        confdir=str(confdir),
+        parallel=2,
+        warningiserror=True,
+        confoverrides={
+            "autoapi_parallel_parse": True,
+            "autoapi_pure_docstring_handlers": ["_process_docstring"],
+            "exclude_patterns": ["manualapi.rst"],
+        },
+    )
+
+    pids = set(calls_file.read_text().splitlines())
+    assert pids
+    # Class docstrings are combined with constructor docstrings in this project,
+    # so they are processed by the main process.
+    assert len(pids - {str(os.getpid())}) >= 1
+    example_file = pathlib.Path("_build/html/autoapi/example/index.html")
+    assert "Processed by a handler." in example_file.read_text()
+
+
 class TestComplexPackage:
     @pytest.fixture(autouse=True, scope="class")
     def built(self, builder):
@@ -1155,6 +1566,25 @@ class TestComplexPackageParallel(TestComplexPackage):
         builder("pypackagecomplex", parallel=2)
 
 
+class TestComplexPackageParallelParse(TestComplexPackage):
+    @pytest.fixture(autouse=True, scope="class")
+    def built(self, builder):
+        builder(
+            "pypackagecomplex",
+            parallel=2,
+            confoverrides={"autoapi_parallel_parse": True},
+        )
+
+
+class TestComplexPackageReleasedAstroidCache(TestComplexPackage):
+    @pytest.fixture(autouse=True, scope="class")
+    def built(self, builder):
+        builder(
+            "pypackagecomplex",
+            confoverrides={"autoapi_release_astroid_cache": True},
+        )
+
+
 def test_caching(builder, rebuild):
     mtimes = (0, 0)
 
@@ -1200,6 +1630,97 @@ def test_caching(builder, rebuild):
     assert mtimes[1] != mtimes[0]
 
 
+def test_caching_by_stage(builder, rebuild, monkeypatch):
+    read_files = []
+    read_file = Mapper.read_file
+
+    def _read_file(self, path, **kwargs):
+        read_files.append(path)
+        return read_file(self, path, **kwargs)
+
+    monkeypatch.setattr(Mapper, "read_file", _read_file)
+
+    index_path = pathlib.Path("autoapi/complex/index.rst")
+    confoverrides = {"autoapi_keep_files": True}
+    builder("pypackagecomplex", confoverrides=confoverrides)
+    assert read_files
+    assert "public_chain" in index_path.read_text()
+    assert pathlib.Path("_build/.doctrees/autoapi_parsed.pickle").is_file()
+    index_mtime = os.path.getmtime(index_path)
+
+    # Changing a setting that autoapi does not depend on reads and renders nothing
+    read_files.clear()
+    rebuild(confoverrides={**confoverrides, "rst_epilog": ".. |x| replace:: x"})
+    assert not read_files
+    assert os.path.getmtime(index_path) == index_mtime
+
+    # Changing a rendering setting renders again without reading files
+    read_files.clear()
+    options = ["members", "undoc-members", "show-module-summary"]
+    rebuild(confoverrides={**confoverrides, "autoapi_options": options})
+    assert not read_files
+    assert "public_chain" not in index_path.read_text()
+
+    # Rendering also depends on the values of other extensions
+    index_mtime = os.stat(index_path).st_mtime_ns
+    confoverrides = {**confoverrides, "autodoc_typehints": "none"}
+    rebuild(confoverrides={**confoverrides, "autoapi_options": options})
+    assert not read_files
+    assert os.stat(index_path).st_mtime_ns != index_mtime
+
+    # Changing a reading setting reads the files again
+    rebuild(
+        confoverrides={
+            **confoverrides,
+            "autoapi_options": options,
+            "autoapi_follow_symlinks": True,
+        }
+    )
+    assert read_files
+
+
+def test_config_values_are_classified_by_stage():
+    app = MagicMock()
+    autoapi.extension.setup(app)
+    names = {value.args[0] for value in app.add_config_value.call_args_list}
+
+    # These values are given to the read stage as arguments,
+    # are described separately, are only used by directives,
+    # or only affect how fast a build is.
+    unclassified = {
+        "autoapi_base_summary_cache_dir",
+        "autoapi_dirs",
+        "autoapi_docstring_cache_dir",
+        "autoapi_file_patterns",
+        "autoapi_ignore",
+        "autoapi_inheritance_diagram_cache_dir",
+        "autoapi_inheritance_diagram_source",
+        "autoapi_keep_files",
+        "autoapi_nested_parse_cache_dir",
+        "autoapi_parallel_parse",
+        "autoapi_prepare_jinja_env",
+        "autoapi_pure_docstring_handlers",
+        "autoapi_release_astroid_cache",
+    }
+    assert names - set(_PARSE_CONFIG) - set(_RENDER_CONFIG) == unclassified
+
+    # Values registered by Sphinx and its extensions are read by name
+    # while objects are mapped and rendered.
+    package_dir = pathlib.Path(autoapi.extension.__file__).parent
+    sources = [
+        package_dir / "_objects.py",
+        package_dir / "_mapper.py",
+        package_dir / "extension.py",
+        *(package_dir / "templates").rglob("*.rst"),
+    ]
+    read = set()
+    for source in sources:
+        read.update(re.findall(r"config(?:\.|\[\"|, \")(\w+)", source.read_text()))
+    core_read = {name for name in read if not name.startswith("autoapi_")}
+    assert core_read == {"autodoc_typehints", "source_suffix"}
+    assert core_read <= set(_RENDER_CONFIG)
+
+
 class TestImplicitNamespacePackage:
     @pytest.fixture(autouse=True, scope="class")
     def built(self, builder):
@@ -1246,6 +1767,117 @@ def test_custom_jinja_filters(builder, parse, tmp_path):
     assert "This is using custom filters." in foo.text
 
 
+def test_class_derived_values_are_cached():
+    app = Mock()
+    app.config.autodoc_typehints = "signature"
+
+    def _data(name, doc, **kwargs):
+        return dict(name=name, qual_name=name, full_name=name, doc=doc, **kwargs)
+
+    cls = PythonClass(
+        _data("A", "Class doc.", bases=[]),
+        jinja_env=None,
+        app=app,
+        url_root="",
+        class_content="both",
+    )
+    assert cls.constructor is None
+    assert cls.docstring == "Class doc."
+
+    init_data = _data(
+        "__init__",
+        "Init doc.",
+        args=[(None, "self", None, None), (None, "x", "int", None)],
+        overloads=[],
+        return_annotation=None,
+        properties=[],
+        is_overload=False,
+    )
+    init = PythonMethod(init_data, jinja_env=None, app=app, url_root="")
+    cls.add_child(init)
+
+    assert cls.constructor is init
+    assert cls.args == "x: int"
+    assert cls.docstring == "Class doc.\nInit doc."
+    assert cls.summary == "Class doc."
+    assert cls.overloads is cls.overloads
+
+    cls.docstring = "New doc."
+    assert cls.docstring == "New doc."
+    assert cls.summary == "New doc."
+    assert cls.constructor is init
+
+
+def test_child_index_follows_changes():
+    app = Mock()
+
+    def _function(name):
+        data = dict(
+            name=name,
+            qual_name=name,
+            full_name=name,
+            doc="",
+            args=[],
+            return_annotation=None,
+            properties=[],
+            overloads=[],
+            is_overload=False,
+        )
+        return PythonFunction(data, jinja_env=None, app=app, url_root="")
+
+    module = PythonModule(
+        dict(name="mod", qual_name="mod", full_name="mod", doc="", all=None),
+        jinja_env=None,
+        app=app,
+        url_root="",
+    )
+    b_func = _function("b")
+    a_func = _function("a")
+    module.add_child(b_func)
+    module.add_child(a_func)
+    assert module.functions == [b_func, a_func]
+
+    module.sort_children(key=lambda child: child.name)
+    assert module.functions == [a_func, b_func]
+
+    other_a_func = _function("a")
+    module.children = [other_a_func, b_func]
+    assert module.get_child("a") is other_a_func
+    assert module.functions == [other_a_func, b_func]
+
+
+def test_visible_children_by_type():
+    app = Mock()
+
+    def _object(cls, name, **kwargs):
+        data = dict(name=name, qual_name=name, full_name=name, doc="", **kwargs)
+        return cls(data, jinja_env=None, app=app, url_root="")
+
+    module = _object(PythonModule, "mod", all=None)
+    function = _object(
+        PythonFunction,
+        "func",
+        args=[],
+        return_annotation=None,
+        properties=[],
+        overloads=[],
+        is_overload=False,
+    )
+    data = _object(PythonData, "data", value=None, annotation=None)
+    module.add_child(function)
+    module.add_child(data)
+
+    assert module.functions == [function]
+    assert module.visible_children == []
+    assert module.visible_children_of_type("function") == []
+
+    module._add_visible_child(function)
+
+    assert module.visible_children == [function]
+    assert module.visible_children_of_type("function") == [function]
+    assert module.visible_children_of_type("data") == []
+
+
 def test_string_module_attributes(builder):
     """Test toggle for multi-line string attribute values (GitHub #267)."""
     keep_rst = {
@@ -1314,6 +1946,218 @@ def test_no_files_found(builder):
     assert os.path.dirname(__file__) in str(exc_info.value)
 
 
+def test_strongly_connected_components():
+    # A chain deeper than the recursion limit
+    graph = {f"m{i}": [f"m{i + 1}"] for i in range(sys.getrecursionlimit() * 2)}
+    graph["a"] = ["b", "m0"]
+    graph["b"] = ["a"]
+    graph[f"m{sys.getrecursionlimit() * 2}"] = []
+
+    components = list(_strongly_connected_components(graph))
+
+    assert len(components) == len(graph) - 1
+    assert sorted(components[-1]) == ["a", "b"]
+    order = {node: i for i, component in enumerate(components) for node in component}
+    assert all(order[target] <= order[node] for node in graph for target in graph[node])
+
+
+def _module_data(name, children):
+    return {
+        "type": "module",
+        "name": name,
+        "qual_name": name,
+        "full_name": name,
+        "all": None,
+        "children": children,
+    }
+
+
+def _object_data(module_name, name):
+    return {
+        "type": "data",
+        "name": name,
+        "qual_name": name,
+        "full_name": f"{module_name}.{name}",
+    }
+
+
+def _placeholder_data(module_name, name, original_path):
+    return dict(
+        _object_data(module_name, name),
+        type="placeholder",
+        original_path=original_path,
+    )
+
+
+@pytest.mark.parametrize("component", [["a", "b"], ["b", "a"]])
+def test_resolve_cyclic_placeholders(component):
+    modules = {}
+    for module in (
+        _module_data("a", [_placeholder_data("a", "x", "b.x"), _object_data("a", "y")]),
+        _module_data("b", [_placeholder_data("b", "y", "a.y"), _object_data("b", "x")]),
+    ):
+        children = {child["name"]: child for child in module["children"]}
+        modules[module["name"]] = (module, children)
+
+    _resolve_component_placeholders(modules, component)
+
+    a_x = modules["a"][1]["x"]
+    assert a_x["type"] == "data"
+    assert a_x["full_name"] == "a.x"
+    assert a_x["original_path"] == "b.x"
+    b_y = modules["b"][1]["y"]
+    assert b_y["type"] == "data"
+    assert b_y["original_path"] == "a.y"
+
+
+def test_duplicate_module_names_keep_last_module(builder, rebuild, tmp_path):
+    os.chdir(tmp_path)
+    for dir_name, docstring in (("a", "first"), ("b", "second")):
+        (tmp_path / dir_name).mkdir()
+        (tmp_path / dir_name / "mod.py").write_text(f'"""{docstring}"""\n')
+    (tmp_path / "conf.py").write_text(
+        'extensions = ["autoapi.extension"]\n'
+        'autoapi_dirs = ["a", "b"]\n'
+        "autoapi_keep_files = True\n"
+    )
+    (tmp_path / "index.rst").write_text("Test\n====\n")
+
+    rebuild()
+
+    assert "second" in (tmp_path / "autoapi" / "mod" / "index.rst").read_text()
+
+
+def test_visit_data():
+    module = _module_data(
+        "a",
+        [
+            dict(_object_data("a", "A"), children=[_object_data("a.A", "method")]),
+            _object_data("a", "b"),
+        ],
+    )
+    visited = []
+    seen = []
+
+    _visit_data(
+        [module],
+        [
+            lambda root, parent, obj, path: visited.append((parent["name"], path)),
+            lambda root, parent, obj, path: seen.append(root["name"]),
+        ],
+    )
+
+    assert visited == [("a", "A"), ("A", "A.method"), ("a", "b")]
+    assert seen == ["a", "a", "a"]
+
+
+def test_wildcard_exports_are_shared(caplog):
+    a = _module_data("a", [_object_data("a", "x"), _object_data("a", "y")])
+    a["all"] = ["x", "missing"]
+    modules = {"a": (a, {child["name"]: child for child in a["children"]})}
+    for name in ("b", "c"):
+        placeholder = _placeholder_data(name, "*", "a.*")
+        modules[name] = (_module_data(name, [placeholder]), {"*": placeholder})
+
+    # Sphinx stops its loggers from propagating once an application is set up,
+    # so capture the warnings from the autoapi logger itself.
+    logger = sphinx.util.logging.getLogger("autoapi").logger
+    logger.addHandler(caplog.handler)
+    try:
+        exports = {}
+        for component in (["a"], ["b"], ["c"]):
+            _resolve_component_placeholders(modules, component, exports)
+    finally:
+        logger.removeHandler(caplog.handler)
+
+    assert [child["full_name"] for child in modules["b"][0]["children"]] == ["b.x"]
+    assert [child["full_name"] for child in modules["c"][0]["children"]] == ["c.x"]
+    assert modules["b"][1]["x"] is not modules["c"][1]["x"]
+    # The same record can be captured by both the root and the autoapi logger.
+    warnings = {
+        id(record) for record in caplog.records if "Invalid __all__" in record.message
+    }
+    assert len(warnings) == 1
+
+
+def test_find_files(tmp_path):
+    for path in (
+        "package/__init__.py",
+        "package/module.py",
+        "package/module.pyi",
+        "package/stub_only.pyi",
+        "package/data.txt",
+        "package/migrations/0001_initial.py",
+        "package/sub/ignored_file.py",
+        "package/sub/kept.py",
+    ):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+
+    found = Mapper.find_files(
+        patterns=["*.py", "*.pyi"],
+        dirs=[str(tmp_path / "package")],
+        ignore=["*migrations*", "*/ignored_*"],
+        follow_symlinks=False,
+    )
+
+    assert sorted(os.path.relpath(path, tmp_path) for path in found) == [
+        os.path.join("package", "__init__.py"),
+        os.path.join("package", "module.py"),
+        os.path.join("package", "stub_only.pyi"),
+        os.path.join("package", "sub", "kept.py"),
+    ]
+
+
+def test_find_files_reuses_unchanged_directories(tmp_path, monkeypatch):
+    (tmp_path / "package" / "sub").mkdir(parents=True)
+    (tmp_path / "package" / "__init__.py").touch()
+    (tmp_path / "package" / "sub" / "module.py").touch()
+
+    def find_files(listings):
+        found = Mapper.find_files(
+            patterns=["*.py"],
+            dirs=[str(tmp_path / "package")],
+            ignore=[],
+            follow_symlinks=False,
+            listings=listings,
+        )
+        return sorted(os.path.relpath(path, tmp_path) for path in found)
+
+    listings = _DirectoryListings(((), False))
+    assert find_files(listings) == [
+        os.path.join("package", "__init__.py"),
+        os.path.join("package", "sub", "module.py"),
+    ]
+
+    scanned = []
+    scandir = os.scandir
+
+    def record_scandir(path):
+        scanned.append(os.path.relpath(path, tmp_path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", record_scandir)
+
+    listings = _DirectoryListings(((), False), listings)
+    assert len(find_files(listings)) == 2
+    assert scanned == []
+
+    new_file = tmp_path / "package" / "sub" / "new.py"
+    new_file.touch()
+    sub_dir = tmp_path / "package" / "sub"
+    # Make sure that the change is visible on file systems with coarse timestamps
+    mtime = os.stat(sub_dir).st_mtime_ns + 1_000_000_000
+    os.utime(sub_dir, ns=(mtime, mtime))
+
+    listings = _DirectoryListings(((), False), listings)
+    assert find_files(listings) == [
+        os.path.join("package", "__init__.py"),
+        os.path.join("package", "sub", "module.py"),
+        os.path.join("package", "sub", "new.py"),
+    ]
+    assert scanned == [os.path.join("package", "sub")]
+
+
 class TestMdSource:
     @pytest.fixture(autouse=True, scope="class")
     def built(self, builder):
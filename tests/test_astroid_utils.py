@@ -229,3 +229,151 @@ class TestAstroidUtils:
         args_info = _astroid_utils.get_args_info(node.args)
         formatted = _objects._format_args(args_info)
         assert formatted == expected
+
+    def test_get_ancestors_matches_astroid(self):
+        node = astroid.extract_node(
+            """
+            import collections
+
+            class A(collections.OrderedDict):
+                pass
+
+            class B(A, ValueError): #@
+                pass
+        """
+        )
+
+        ancestors = list(_astroid_utils.get_ancestors(node, budget=100))
+        assert ancestors == list(node.ancestors())
+
+    def test_get_ancestors_stops_at_boundary(self):
+        node = astroid.extract_node(
+            """
+            from collections import OrderedDict
+
+            class A(OrderedDict): #@
+                '''A docstring.'''
+        """
+        )
+
+        ancestors = _astroid_utils.get_ancestors(
+            node, boundary=frozenset({"collections"})
+        )
+        assert list(ancestors) == []
+
+    def test_is_exception_with_budget(self):
+        node = astroid.extract_node(
+            """
+            class A(ValueError):
+                pass
+
+            class B(A): #@
+                pass
+        """
+        )
+
+        assert _astroid_utils.is_exception(node)
+        assert not _astroid_utils.is_exception(node, budget=1)
+        assert _astroid_utils.is_exception(node, budget=3)
+
+    def test_decorator_checks_are_cached_per_module(self, monkeypatch):
+        module = astroid.parse(
+            """
+            class A:
+                @property
+                def a(self):
+                    pass
+
+                @property
+                def b(self):
+                    pass
+        """
+        )
+
+        checked = []
+        is_property_decorator = _astroid_utils._is_property_decorator
+
+        def record_check(decorator, *args):
+            checked.append(decorator.as_string())
+            return is_property_decorator(decorator, *args)
+
+        monkeypatch.setattr(_astroid_utils, "_is_property_decorator", record_check)
+
+        methods = list(module.body[0].mymethods())
+        assert all(_astroid_utils.is_decorated_with_property(m) for m in methods)
+        assert checked == ["property"]
+
+    def test_decorator_checks_are_cached_by_lookup_scope(self):
+        module = astroid.parse(
+            """
+            def notprop(func):
+                return func
+
+            class A:
+                prop = property
+
+                @prop
+                def x(self):
+                    pass
+
+            class B:
+                prop = notprop
+
+                @prop
+                def y(self):
+                    pass
+        """
+        )
+
+        x = next(module.body[1].mymethods())
+        y = next(module.body[2].mymethods())
+        assert _astroid_utils.is_decorated_with_property(x)
+        assert not _astroid_utils.is_decorated_with_property(y)
+
+    def test_resolve_qualname_is_cached_by_scope(self):
+        module = astroid.parse(
+            """
+            from collections import OrderedDict
+
+            def a(x: OrderedDict):
+                pass
+
+            def b(x: OrderedDict):
+                pass
+
+            def c(x: OrderedDict):
+                OrderedDict = dict
+        """
+        )
+
+        _astroid_utils.clear_qualname_cache()
+        resolved = [
+            _astroid_utils.format_annotation(func.args.annotations[0])
+            for func in module.body[1:]
+        ]
+        assert resolved == [
+            "collections.OrderedDict",
+            "collections.OrderedDict",
+            "c.OrderedDict",
+        ]
+        assert _astroid_utils.clear_qualname_cache() == (1, 2)
+
+    def test_resolve_qualname_of_rebound_name(self):
+        module = astroid.parse(
+            """
+            from a import X
+
+            class A(X):
+                pass
+
+            from b import X
+
+            class B(X):
+                pass
+        """
+        )
+
+        _astroid_utils.clear_qualname_cache()
+        classes = [module.body[1], module.body[3]]
+        resolved = [_astroid_utils.get_base_qualname(cls.bases[0]) for cls in classes]
+        assert resolved == ["a.X", "b.X"]
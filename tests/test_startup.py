@@ -0,0 +1,61 @@
+import json
+import statistics
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+# Set up the extension in a fresh interpreter,
+# so that nothing has been imported by other tests.
+_SETUP_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import sys
+    import tempfile
+    import time
+
+    from sphinx.application import Sphinx
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        open(f"{tmp_dir}/conf.py", "w").close()
+        app = Sphinx(
+            srcdir=tmp_dir,
+            confdir=tmp_dir,
+            outdir=f"{tmp_dir}/_build",
+            doctreedir=f"{tmp_dir}/_build/.doctrees",
+            buildername="dummy",
+            status=None,
+        )
+        start = time.perf_counter()
+        app.setup_extension("autoapi.extension")
+        elapsed = time.perf_counter() - start
+
+    print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+    """
+)
+
+
+def _run_setup():
+    output = subprocess.run(
+        [sys.executable, "-c", _SETUP_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_setup_does_not_import_parser():
+    modules = _run_setup()["modules"]
+
+    assert "astroid" not in modules
+    assert "autoapi._parser" not in modules
+    assert "autoapi._mapper" not in modules
+
+
+@pytest.mark.benchmark
+def test_setup_time(record_property):
+    times = [_run_setup()["elapsed"] for _ in range(5)]
+
+    record_property("setup_time", statistics.median(times))